@@ -15,14 +15,20 @@ Disclaimer:
 """
 
 import argparse
+import os
+import pickle
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service as ChromeService
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException
+from selenium.common.exceptions import (
+    ElementNotInteractableException,
+    TimeoutException,
+)
 
 try:
     # Use webdriver_manager if available to download/manage chromedriver automatically
@@ -35,18 +41,125 @@ except ImportError:
 
 COMMENT_TEXT = "Be aware of Dark Technology #DarkTech"
 
+# Session cookies saved after a successful login so repeated runs can skip the
+# multi-second login flow entirely.
+COOKIE_FILE = ".botsim_cookies.pkl"
+
+# WebDriverWait polls every 500 ms by default; the target app typically has
+# elements ready within tens of ms, so poll every 100 ms to avoid waiting up
+# to 400 ms past the moment an element appears.
+_POLL_FREQUENCY = 0.1
+
+
+def _get_wait(driver, timeout: int = 10) -> WebDriverWait:
+    """Return a WebDriverWait for this driver, reusing one per timeout.
+
+    The waits are cached on the driver instance, so every call site shares the
+    same objects and there is a single place that controls the poll interval.
+    """
+    waits = getattr(driver, "_bot_waits", None)
+    if waits is None:
+        waits = driver._bot_waits = {}
+    if timeout not in waits:
+        waits[timeout] = WebDriverWait(driver, timeout, poll_frequency=_POLL_FREQUENCY)
+    return waits[timeout]
+
+
+# ---------------------------------------------------------------------------
+# XPath constants
+# ---------------------------------------------------------------------------
+# The target DOM is fixed at deploy time, so all lookup strategies are
+# constants. Defining them once at module scope avoids rebuilding the same
+# strings and lists on every call (and on every post in the hot loops).
+
+# A post's comments block: a <details> whose <summary> mentions 'Comments'.
+_COMMENT_SECTION_XPATH = (
+    "//details[.//summary[contains("
+    "translate(normalize-space(),'COMMENTS','comments'),'comments')]]"
+)
+
+# Strategies for locating the e-mail input, in order of preference.
+_EMAIL_INPUT_XPATHS = (
+    # input type="email"
+    "//input[@type='email']",
+    # placeholder mentioning 'mail' (e.g. "Enter your school e-mail")
+    "//input[contains(translate(@placeholder, 'MAIL','mail'),'mail')]",
+    # aria-label mentioning 'mail' (Streamlit often uses aria-label from label)
+    "//input[contains(translate(@aria-label, 'MAIL','mail'),'mail')]",
+    # fallback: first visible text input
+    "//input[@type='text']",
+)
+
+# One union XPath covering all strategies at once. Waiting on the union means
+# a single timeout budget instead of stacking a full wait per strategy (four
+# sequential 10 s waits in the worst case).
+_EMAIL_INPUT_UNION_XPATH = " | ".join(_EMAIL_INPUT_XPATHS)
+
+# Strategies for locating the login/register button.
+_LOGIN_BUTTON_XPATHS = (
+    # Any button whose visible text mentions 'log' (login / log in)
+    "//button[contains(translate(., 'LOG','log'),'log')]",
+    # Any button whose visible text mentions 'register'
+    "//button[contains(translate(., 'REGISTER','register'),'register')]",
+    # As a last resort, any clickable button
+    "//button",
+)
+
+_LOGIN_BUTTON_UNION_XPATH = " | ".join(_LOGIN_BUTTON_XPATHS)
+
 
 # ---------------------------------------------------------------------------
 # WebDriver initialisation
 # ---------------------------------------------------------------------------
 
-def get_driver() -> webdriver.Chrome:
-    """Initialise the Chrome webdriver, using webdriver_manager if available."""
+# Resolved chromedriver path, cached for the lifetime of the process.
+# ChromeDriverManager().install() hits the network to resolve the driver
+# version even when the binary is already on disk, so only do it once.  The
+# ChromeService itself must be fresh per driver: driver.quit() stops its
+# service, so sharing one would let the first worker to quit kill the
+# chromedriver process under every other live session.
+_driver_path = None
+
+
+def _get_service() -> ChromeService:
+    """Return a new ChromeService, resolving the driver path only once."""
+    global _driver_path
+    if USE_WDM and _driver_path is None:
+        _driver_path = ChromeDriverManager().install()
+    return ChromeService(_driver_path) if _driver_path else ChromeService()
+
+
+def get_driver(headless: bool = True) -> webdriver.Chrome:
+    """Initialise the Chrome webdriver, using webdriver_manager if available.
+
+    By default the browser runs headless with images disabled: the bot never
+    renders anything for a human, so skipping the GUI, GPU and image downloads
+    cuts page-load time and memory considerably. Pass ``headless=False`` (or
+    ``--no-headless`` on the command line) to watch the bot work.
+    """
+    options = webdriver.ChromeOptions()
+    # Return from driver.get() as soon as DOMContentLoaded fires instead of
+    # waiting for every subresource. The bot only needs the DOM to query
+    # elements, and the explicit waits cover anything rendered later.
+    options.page_load_strategy = "eager"
+    if headless:
+        options.add_argument("--headless=new")
+        options.add_argument("--disable-gpu")
+        options.add_argument("--no-sandbox")
+        options.add_argument("--disable-dev-shm-usage")
+    # The bot only queries the DOM, so never spend bandwidth on images,
+    # extensions or Chrome's own background traffic.
+    options.add_argument("--blink-settings=imagesEnabled=false")
+    options.add_argument("--disable-extensions")
+    options.add_argument("--disable-background-networking")
+    options.add_experimental_option(
+        "prefs", {"profile.managed_default_content_settings.images": 2}
+    )
     if USE_WDM:
-        return webdriver.Chrome(service=ChromeService(ChromeDriverManager().install()))
+        return webdriver.Chrome(service=_get_service(), options=options)
     else:
         # Assumes chromedriver is in PATH
-        return webdriver.Chrome()
+        return webdriver.Chrome(options=options)
 
 
 # ---------------------------------------------------------------------------
@@ -67,79 +180,21 @@ def login(driver: webdriver.Chrome, base_url: str, email: str) -> None:
     One of these strategies should always succeed as long as the login e-mail
     input somehow references 'mail' and the button mentions login/register.
     """
-    driver.get(base_url)
-    wait = WebDriverWait(driver, 10)
-
-    # Try to navigate to the Login page via the sidebar nav link.
-    # Streamlit renders these links as <a data-testid="stSidebarNavLink"> with
-    # a <span> child containing the page label.
-    try:
-        login_link = wait.until(
-            EC.element_to_be_clickable(
-                (
-                    By.XPATH,
-                    "//a[@data-testid='stSidebarNavLink']"
-                    "[.//span[contains(translate(normalize-space(),'LOGIN','login'),'login')]]",
-                )
-            )
-        )
-        login_link.click()
-        time.sleep(2)
-    except TimeoutException:
-        # If the sidebar link isn't found, we assume we are already on the login page.
-        pass
+    # Streamlit multipage URLs are stable, so go straight to the Login page
+    # instead of loading the home page and clicking through the sidebar —
+    # that saves a full page transition and its waits.
+    driver.get(base_url.rstrip("/") + "/Login")
+    wait = _get_wait(driver)
 
     # ---------- Find an input element suitable for entering the e-mail ----------
 
-    email_input = None
-
-    # Strategy 1: input type="email"
     try:
         email_input = wait.until(
-            EC.presence_of_element_located((By.XPATH, "//input[@type='email']"))
+            EC.presence_of_element_located((By.XPATH, _EMAIL_INPUT_UNION_XPATH))
         )
     except TimeoutException:
         email_input = None
 
-    # Strategy 2: placeholder mentioning 'mail' (e.g. "Enter your school e-mail")
-    if email_input is None:
-        try:
-            email_input = wait.until(
-                EC.presence_of_element_located(
-                    (
-                        By.XPATH,
-                        "//input[contains(translate(@placeholder,"
-                        " 'MAIL','mail'),'mail')]",
-                    )
-                )
-            )
-        except TimeoutException:
-            email_input = None
-
-    # Strategy 3: aria-label mentioning 'mail' (Streamlit often uses aria-label from label)
-    if email_input is None:
-        try:
-            email_input = wait.until(
-                EC.presence_of_element_located(
-                    (
-                        By.XPATH,
-                        "//input[contains(translate(@aria-label,"
-                        " 'MAIL','mail'),'mail')]",
-                    )
-                )
-            )
-        except TimeoutException:
-            email_input = None
-
-    # Fallback: first visible text input
-    if email_input is None:
-        try:
-            email_input = wait.until(
-                EC.presence_of_element_located((By.XPATH, "//input[@type='text']"))
-            )
-        except TimeoutException:
-            email_input = None
-
     if email_input is None:
         raise RuntimeError("Unable to locate email input field on login page.")
 
@@ -149,181 +204,309 @@ def login(driver: webdriver.Chrome, base_url: str, email: str) -> None:
         # Some inputs complain if you clear before typing; it's safe to ignore.
         pass
     email_input.send_keys(email)
+    # Streamlit inputs are React-controlled and sync their state
+    # asynchronously; confirm the value landed before submitting.
+    try:
+        wait.until(lambda d: email_input.get_attribute("value") == email)
+    except TimeoutException:
+        pass
 
     # ---------- Find the login/register button ----------
 
-    login_button = None
-    button_xpaths = [
-        # Any button whose visible text mentions 'log' (login / log in)
-        "//button[contains(translate(., 'LOG','log'),'log')]",
-        # Any button whose visible text mentions 'register'
-        "//button[contains(translate(., 'REGISTER','register'),'register')]",
-        # As a last resort, any clickable button
-        "//button",
-    ]
-
-    for xpath in button_xpaths:
-        try:
-            candidate = wait.until(
-                EC.element_to_be_clickable((By.XPATH, xpath))
-            )
-            if candidate:
-                login_button = candidate
-                break
-        except TimeoutException:
-            continue
+    try:
+        login_button = wait.until(
+            EC.element_to_be_clickable((By.XPATH, _LOGIN_BUTTON_UNION_XPATH))
+        )
+    except TimeoutException:
+        login_button = None
 
     if login_button is None:
         raise RuntimeError("Unable to locate login/register button on login page.")
 
     login_button.click()
-    # Wait a bit for login to complete / redirect
-    time.sleep(3)
+    # Wait for login to complete: Streamlit re-renders the page, which makes the
+    # old button reference stale. This fires the moment the rerun happens instead
+    # of after a fixed worst-case sleep.
+    try:
+        wait.until(EC.staleness_of(login_button))
+    except TimeoutException:
+        # Some logins update in place without replacing the button; carry on.
+        pass
 
 
 # ---------------------------------------------------------------------------
-# Navigation to feed
+# Session persistence
 # ---------------------------------------------------------------------------
 
-def navigate_to_feed(driver: webdriver.Chrome) -> None:
-    """
-    Navigate to the Feed page using the sidebar or a URL.
+def save_cookies(driver: webdriver.Chrome) -> None:
+    """Persist the current session cookies so the next run can skip login."""
+    try:
+        with open(COOKIE_FILE, "wb") as fh:
+            pickle.dump(driver.get_cookies(), fh)
+    except Exception as exc:
+        print(f"Could not save session cookies: {exc}")
+
+
+def restore_session(driver: webdriver.Chrome, base_url: str) -> bool:
+    """Try to restore a previous session from saved cookies.
 
-    This assumes the sidebar has a link labelled 'Feed' (as in the Streamlit UI).
+    Loads the site, injects the saved cookies and refreshes, then checks
+    whether the app greets us as logged in. Returns True when the session is
+    live (so ``login()`` can be skipped), False when a fresh login is needed.
     """
-    wait = WebDriverWait(driver, 10)
+    if not os.path.exists(COOKIE_FILE):
+        return False
+    try:
+        with open(COOKIE_FILE, "rb") as fh:
+            cookies = pickle.load(fh)
+    except Exception as exc:
+        print(f"Could not read saved cookies: {exc}")
+        return False
+
+    driver.get(base_url)
+    for cookie in cookies:
+        try:
+            driver.add_cookie(cookie)
+        except Exception:
+            # Cookies with mismatched domains are rejected; skip them.
+            continue
+    driver.refresh()
+    # The home page shows a "Logged in as ..." banner for active sessions.
     try:
-        feed_link = wait.until(
-            EC.element_to_be_clickable(
+        _get_wait(driver, 5).until(
+            EC.presence_of_element_located(
                 (
                     By.XPATH,
-                    "//a[@data-testid='stSidebarNavLink']"
-                    "[.//span[contains(translate(normalize-space(),'FEED','feed'),'feed')]]",
+                    "//*[contains(translate(., 'LOGGED IN', 'logged in'),'logged in')]",
                 )
             )
         )
-        feed_link.click()
-        time.sleep(2)
+        return True
     except TimeoutException:
-        # Fallback: try adding a path fragment – this is more of a demo than a guarantee.
-        driver.get(driver.current_url.rstrip("/") + "/Feed")
-        time.sleep(2)
+        return False
+
+
+# ---------------------------------------------------------------------------
+# Navigation to feed
+# ---------------------------------------------------------------------------
+
+def navigate_to_feed(driver: webdriver.Chrome, base_url: str) -> None:
+    """
+    Navigate directly to the Feed page URL.
+
+    Streamlit multipage apps serve each page under a stable path, so a single
+    navigation replaces the old load-home-then-click-the-sidebar round trip.
+    """
+    wait = _get_wait(driver)
+    driver.get(base_url.rstrip("/") + "/Feed")
+    # Wait until something feed-specific shows up (a post's comments block)
+    # instead of sleeping a fixed two seconds.
+    try:
+        wait.until(EC.presence_of_element_located((By.XPATH, _COMMENT_SECTION_XPATH)))
+    except TimeoutException:
+        # The feed may legitimately have no posts yet; comment_on_posts handles that.
+        pass
 
 
 # ---------------------------------------------------------------------------
 # Commenting on posts
 # ---------------------------------------------------------------------------
 
-def comment_on_posts(driver: webdriver.Chrome, comment: str) -> None:
+# Collect every comment section in one browser round-trip: each entry is a
+# [details, input, button] triple, with collapsed sections opened on the way.
+# Doing this in JavaScript replaces ~5 WebDriver round-trips per post (each
+# find_element costs ~10-15 ms) with a single execute_script call.
+def _wait_for_comment_sections(driver: webdriver.Chrome, wait: WebDriverWait) -> bool:
+    """Wait until the feed's comment sections have finished appearing.
+
+    Streamlit streams posts in progressively during a rerun, so grabbing the
+    sections at the first match can miss late arrivals. After the first
+    section shows up, wait for document.readyState to settle and then poll the
+    section count until it is stable across two consecutive samples. Returns
+    False if no section ever appears.
+    """
+    try:
+        wait.until(
+            EC.presence_of_all_elements_located((By.XPATH, _COMMENT_SECTION_XPATH))
+        )
+    except TimeoutException:
+        return False
+    try:
+        wait.until(lambda d: d.execute_script("return document.readyState") == "complete")
+    except TimeoutException:
+        pass
+    previous = -1
+    for _ in range(10):
+        current = len(driver.find_elements(By.XPATH, _COMMENT_SECTION_XPATH))
+        if current == previous:
+            break
+        previous = current
+        time.sleep(_POLL_FREQUENCY)
+    return True
+
+
+_COLLECT_COMMENT_SECTIONS_JS = """
+return Array.from(document.querySelectorAll('details'))
+    .filter(d => /comments/i.test((d.querySelector('summary') || {}).textContent || ''))
+    .map(d => {
+        d.open = true;
+        const input = d.querySelector('input[type=text]');
+        const button = Array.from(d.querySelectorAll('button'))
+            .find(b => /comment/i.test(b.textContent)) || d.querySelector('button');
+        return [d, input || null, button || null];
+    });
+"""
+
+def comment_on_posts(driver: webdriver.Chrome, comment: str, indices=None) -> None:
     """
     Post the given comment under each existing post on the feed.
 
-    Instead of trying to identify the entire post card, this function looks for
-    all <details> elements whose <summary> contains 'Comments'. For each such
-    block, it:
-      * ensures the comments section is open,
-      * finds a text input whose placeholder/aria-label includes 'comment',
-      * types the comment,
-      * clicks a button whose text contains both 'add' and 'comment'.
+    If ``indices`` is given, only the comment sections at those (1-based)
+    positions are handled; this lets parallel workers each take a shard of
+    the feed.
+
+    Instead of trying to identify the entire post card, this function asks the
+    browser for all <details> elements whose <summary> contains 'Comments',
+    together with each section's comment input and submit button, in a single
+    JavaScript call. It then only needs to type and click per section.
 
     This shows students how a bot can use reasonable heuristics instead of
     relying on a single brittle selector.
     """
-    wait = WebDriverWait(driver, 10)
+    wait = _get_wait(driver)
 
-    try:
-        details_blocks = wait.until(
-            EC.presence_of_all_elements_located(
-                (
-                    By.XPATH,
-                    "//details[.//summary[contains("
-                    "translate(normalize-space(),'COMMENTS','comments'),'comments')]]",
-                )
-            )
-        )
-    except TimeoutException:
+    if not _wait_for_comment_sections(driver, wait):
         print("No comment sections (details/summary) found on the page.")
         return
 
-    print(f"Found {len(details_blocks)} comment sections.")
+    triples = driver.execute_script(_COLLECT_COMMENT_SECTIONS_JS)
+    print(f"Found {len(triples)} comment sections.")
 
-    for idx, details in enumerate(details_blocks, start=1):
+    for idx, (details, comment_box, add_button) in enumerate(triples, start=1):
+        if indices is not None and idx not in indices:
+            continue
+        if comment_box is None:
+            print(f"[Section {idx}] No suitable comment input field found; skipping.")
+            continue
+        if add_button is None:
+            print(f"[Section {idx}] Could not find an 'add comment' button; skipping.")
+            continue
         try:
-            # Scroll into view to avoid 'element not interactable' issues
-            driver.execute_script(
-                "arguments[0].scrollIntoView({block: 'center'});", details
-            )
-            time.sleep(0.5)
-
-            # Open the comments section if it's collapsed
             try:
-                if details.get_attribute("open") is None:
-                    summary = details.find_element(By.TAG_NAME, "summary")
-                    summary.click()
-                    time.sleep(0.5)
+                comment_box.clear()
             except Exception:
                 pass
-
-            # Find a comment input field inside this details block.
-            comment_box = None
-            comment_input_xpaths = [
-                # any text input whose placeholder mentions 'comment'
-                ".//input[@type='text' and "
-                "contains(translate(@placeholder,'COMMENT','comment'),'comment')]",
-                # placeholder may not be set but aria-label might mention comment
-                ".//input[@type='text' and "
-                "contains(translate(@aria-label,'COMMENT','comment'),'comment')]",
-                # last resort: first text input in the details
-                ".//input[@type='text']",
-            ]
-
-            for cx in comment_input_xpaths:
-                try:
-                    comment_box = details.find_element(By.XPATH, cx)
-                    if comment_box:
-                        break
-                except Exception:
-                    continue
-
-            if comment_box is None:
-                print(f"[Section {idx}] No suitable comment input field found; skipping.")
-                continue
-
+            # Selenium scrolls elements into view on interaction, so no manual
+            # scrollIntoView round-trip is needed. Only scroll as a fallback if
+            # an element genuinely turns out not to be interactable.
             try:
-                comment_box.clear()
-            except Exception:
+                comment_box.send_keys(comment)
+            except ElementNotInteractableException:
+                driver.execute_script(
+                    "arguments[0].scrollIntoView({block: 'center'});", details
+                )
+                comment_box.send_keys(comment)
+            # Streamlit inputs are React-controlled and rebuild on each
+            # keystroke; confirm the full value landed before submitting so
+            # the click can't race the state sync.
+            try:
+                _get_wait(driver, 5).until(
+                    lambda d: comment_box.get_attribute("value") == comment
+                )
+            except TimeoutException:
                 pass
-            comment_box.send_keys(comment)
-
-            # Find the 'Add comment' button: text containing both 'add' and 'comment'
-            add_button = None
-            add_button_xpaths = [
-                ".//button[contains(translate(.,'ADDCOMMENT','addcomment'),'add')"
-                " and contains(translate(.,'ADDCOMMENT','addcomment'),'comment')]",
-                ".//button[contains(translate(.,'COMMENT','comment'),'comment')]",
-                ".//button",
-            ]
-            for bx in add_button_xpaths:
-                try:
-                    candidate = details.find_element(By.XPATH, bx)
-                    if candidate:
-                        add_button = candidate
-                        break
-                except Exception:
-                    continue
-
-            if add_button is None:
-                print(f"[Section {idx}] Could not find an 'add comment' button; skipping.")
-                continue
-
             add_button.click()
-            time.sleep(1)
+            # Streamlit clears the input once the comment is submitted; wait for
+            # that signal instead of a fixed one-second sleep. The rerun may also
+            # make the input stale, which equally means the click went through.
+            try:
+                _get_wait(driver, 5).until(
+                    lambda d: (comment_box.get_attribute("value") or "") == ""
+                )
+            except Exception:
+                pass
             print(f"Commented in section #{idx}")
 
         except Exception as exc:
             print(f"Skipping a comment section due to error: {exc}")
 
 
+# ---------------------------------------------------------------------------
+# Parallel commenting
+# ---------------------------------------------------------------------------
+
+def _comment_worker(base_url: str, cookies, indices, comment: str) -> None:
+    """Spawn a headless browser, restore the session, and comment on a shard.
+
+    Each worker owns its driver — Selenium driver instances are not safe to
+    share between threads.
+    """
+    driver = get_driver()
+    try:
+        driver.get(base_url)
+        for cookie in cookies:
+            try:
+                driver.add_cookie(cookie)
+            except Exception:
+                # Cookies with mismatched domains are rejected; skip them.
+                continue
+        navigate_to_feed(driver, base_url)
+        comment_on_posts(driver, comment, indices=indices)
+    finally:
+        driver.quit()
+
+
+def comment_on_posts_parallel(
+    driver: webdriver.Chrome,
+    base_url: str,
+    comment: str,
+    max_workers: int,
+) -> None:
+    """
+    Comment on all posts using several browsers in parallel.
+
+    The already-logged-in ``driver`` is only used to count comment sections
+    and to export its session cookies. The sections are then split into
+    contiguous shards, and each worker thread drives its own headless Chrome
+    through its shard. Wall time drops roughly linearly with the worker count
+    since each section costs a fixed series of WebDriver round-trips.
+    """
+    wait = _get_wait(driver)
+    if not _wait_for_comment_sections(driver, wait):
+        print("No comment sections (details/summary) found on the page.")
+        return
+
+    total = len(driver.find_elements(By.XPATH, _COMMENT_SECTION_XPATH))
+    workers = max(1, min(max_workers, os.cpu_count() or 2, max(1, total // 2)))
+    if workers == 1:
+        comment_on_posts(driver, comment)
+        return
+
+    print(f"Found {total} comment sections; using {workers} parallel browsers.")
+    cookies = driver.get_cookies()
+    # Contiguous 1-based shards, e.g. 10 posts over 3 workers -> {1..4},{5..7},{8..10}
+    shards = []
+    base, extra = divmod(total, workers)
+    start = 1
+    for i in range(workers):
+        size = base + (1 if i < extra else 0)
+        shards.append(set(range(start, start + size)))
+        start += size
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(_comment_worker, base_url, cookies, shard, comment)
+            for shard in shards
+            if shard
+        ]
+        for future in futures:
+            # Surface worker errors instead of swallowing them silently.
+            try:
+                future.result()
+            except Exception as exc:
+                print(f"A comment worker failed: {exc}")
+
+
 # ---------------------------------------------------------------------------
 # Main entry point
 # ---------------------------------------------------------------------------
@@ -347,13 +530,34 @@ def main():
         default=COMMENT_TEXT,
         help="Text to post as a comment (default: '%(default)s')",
     )
+    parser.add_argument(
+        "--headless",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help="Run Chrome headless (use --no-headless to watch the bot work)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of parallel browsers to comment with (default: 1)",
+    )
     args = parser.parse_args()
 
-    driver = get_driver()
+    driver = get_driver(headless=args.headless)
     try:
-        login(driver, args.base_url, args.email)
-        navigate_to_feed(driver)
-        comment_on_posts(driver, args.comment)
+        # Reuse a saved session when possible; a fresh login costs several
+        # seconds, which adds up when iterating on the commenting logic.
+        if restore_session(driver, args.base_url):
+            print("Restored previous session from cookies; skipping login.")
+        else:
+            login(driver, args.base_url, args.email)
+            save_cookies(driver)
+        navigate_to_feed(driver, args.base_url)
+        if args.workers > 1:
+            comment_on_posts_parallel(driver, args.base_url, args.comment, args.workers)
+        else:
+            comment_on_posts(driver, args.comment)
         print("Done adding comments.")
         # Keep the browser open for a short time to view results
         time.sleep(5)
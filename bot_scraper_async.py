@@ -0,0 +1,181 @@
+"""
+Async automated bot for the Bot Simulation platform (Playwright edition)
+------------------------------------------------------------------------
+To run this script:
+
+    pip install playwright && playwright install chromium
+    python bot_scraper_async.py --email your_email@example.com
+
+This is the high-throughput sibling of ``bot_scraper.py``. The commenting
+workload is I/O-bound (round-trips to the browser and the site), so instead of
+one Selenium driver working through posts sequentially, this version logs in
+once and then fans the comment sections out over several Playwright browser
+contexts running concurrently on one event loop. Playwright's auto-waiting
+also removes the explicit wait scaffolding the Selenium version needs.
+
+Disclaimer:
+    This script interacts with a controlled environment (our own bot simulation).
+    Do not use it to automate actions on public websites without permission, as that
+    can violate terms of service and may be unethical or illegal.
+"""
+
+import argparse
+import asyncio
+import os
+
+try:
+    from playwright.async_api import async_playwright
+except ImportError:  # pragma: no cover - exercised only without playwright
+    async_playwright = None
+
+
+COMMENT_TEXT = "Be aware of Dark Technology #DarkTech"
+
+# Selectors for the Streamlit UI. Playwright's text engine replaces the long
+# case-insensitive XPath translate() tricks from the Selenium version.
+LOGIN_NAV_LINK = "a[data-testid='stSidebarNavLink']:has-text('Login')"
+FEED_NAV_LINK = "a[data-testid='stSidebarNavLink']:has-text('Feed')"
+EMAIL_INPUT = (
+    "input[type='email'], input[placeholder*='mail' i], "
+    "input[aria-label*='mail' i], input[type='text']"
+)
+LOGIN_BUTTON = "button:has-text('Log'), button:has-text('Register')"
+COMMENT_SECTION = "details:has(summary:text-matches('comments', 'i'))"
+COMMENT_INPUT = "input[type='text']"
+ADD_COMMENT_BUTTON = "button:has-text('comment')"
+
+
+async def login(page, base_url: str, email: str) -> None:
+    """Log in or register with the provided e-mail address."""
+    await page.goto(base_url)
+    try:
+        await page.click(LOGIN_NAV_LINK, timeout=10_000)
+    except Exception:
+        # If the sidebar link isn't found, assume we are already on the login page.
+        pass
+    await page.fill(EMAIL_INPUT, email)
+    await page.click(LOGIN_BUTTON)
+    # Streamlit reruns the page after login; wait for the network to settle.
+    await page.wait_for_load_state("networkidle")
+
+
+async def comment_on_shard(context, base_url: str, comment: str, indices) -> None:
+    """Comment on the feed sections at the given (0-based) positions.
+
+    Each worker owns one browser context (its own page and session), so the
+    workers can run concurrently without sharing any browser state.
+    """
+    page = await context.new_page()
+    await page.goto(base_url)
+    try:
+        await page.click(FEED_NAV_LINK, timeout=10_000)
+    except Exception:
+        await page.goto(base_url.rstrip("/") + "/Feed")
+    try:
+        await page.wait_for_selector(COMMENT_SECTION, timeout=10_000)
+    except Exception:
+        print("No comment sections found on the feed.")
+        return
+
+    sections = page.locator(COMMENT_SECTION)
+    count = await sections.count()
+    for idx in indices:
+        if idx >= count:
+            continue
+        details = sections.nth(idx)
+        try:
+            # Open the collapsed section; Playwright auto-waits on the rest.
+            await details.evaluate("d => { d.open = true; }")
+            await details.locator(COMMENT_INPUT).first.fill(comment)
+            await details.locator(ADD_COMMENT_BUTTON).first.click()
+            print(f"Commented in section #{idx + 1}")
+        except Exception as exc:
+            print(f"Skipping section #{idx + 1} due to error: {exc}")
+
+
+async def run(base_url: str, email: str, comment: str, workers: int, headless: bool) -> None:
+    """Log in once, then comment on all posts across concurrent contexts."""
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=headless)
+        # Log in on a primary context and export its session cookies.
+        primary = await browser.new_context()
+        page = await primary.new_page()
+        await login(page, base_url, email)
+        cookies = await primary.cookies()
+
+        # Count the comment sections once so the shards can be computed.
+        try:
+            await page.click(FEED_NAV_LINK, timeout=10_000)
+        except Exception:
+            await page.goto(base_url.rstrip("/") + "/Feed")
+        try:
+            await page.wait_for_selector(COMMENT_SECTION, timeout=10_000)
+        except Exception:
+            print("No comment sections found on the feed.")
+            await browser.close()
+            return
+        total = await page.locator(COMMENT_SECTION).count()
+        print(f"Found {total} comment sections.")
+
+        workers = max(1, min(workers, total))
+        shards = [list(range(i, total, workers)) for i in range(workers)]
+
+        contexts = []
+        for _ in range(workers):
+            context = await browser.new_context()
+            await context.add_cookies(cookies)
+            contexts.append(context)
+        try:
+            await asyncio.gather(
+                *(
+                    comment_on_shard(context, base_url, comment, shard)
+                    for context, shard in zip(contexts, shards)
+                    if shard
+                )
+            )
+        finally:
+            await browser.close()
+    print("Done adding comments.")
+
+
+def main() -> None:
+    if async_playwright is None:
+        raise SystemExit(
+            "playwright is not installed. Run: pip install playwright && playwright install chromium"
+        )
+    parser = argparse.ArgumentParser(
+        description="Automate commenting on bot simulation posts (async, Playwright)."
+    )
+    parser.add_argument(
+        "--email",
+        required=True,
+        help="E-mail address to log in/register with",
+    )
+    parser.add_argument(
+        "--base-url",
+        default="https://botsimulator.responsible-it.nl",
+        help="Base URL of the bot simulation site (default: https://botsimulator.responsible-it.nl)",
+    )
+    parser.add_argument(
+        "--comment",
+        default=COMMENT_TEXT,
+        help="Text to post as a comment (default: '%(default)s')",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=min(4, os.cpu_count() or 2),
+        help="Number of concurrent browser contexts (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--headless",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help="Run the browser headless (use --no-headless to watch the bot work)",
+    )
+    args = parser.parse_args()
+    asyncio.run(run(args.base_url, args.email, args.comment, args.workers, args.headless))
+
+
+if __name__ == "__main__":
+    main()
@@ -8,14 +8,25 @@ functionality is implemented in the pages contained in the ``pages`` directory.
 import streamlit as st
 
 
-def main() -> None:
-    st.set_page_config(page_title="Bot Workshop", page_icon="🤖")
-    st.title("Bot Workshop")
-    st.write(
+@st.cache_data
+def _welcome_text() -> str:
+    """Return the static welcome copy, cached across Streamlit reruns."""
+    return (
         "Welcome to the Bot Workshop! Use the navigation menu in the sidebar "
         "to log in, view the social feed, create bots, or (if you are an instructor) "
         "run bots and view their activity logs."
     )
+
+
+def main() -> None:
+    st.set_page_config(page_title="Bot Workshop", page_icon="🤖")
+    # Warm the Appwrite clients now so the first user interaction doesn't pay
+    # the client-construction and TLS-handshake cost.
+    from helpers.warmup import warm_clients
+
+    warm_clients()
+    st.title("Bot Workshop")
+    st.write(_welcome_text())
     if 'user' in st.session_state:
         user = st.session_state['user']
         st.info(f"Logged in as {user.get('email')}. Navigate to the Feed, Bots or Analysis pages using the sidebar.")
@@ -7,7 +7,9 @@ local development but expects these variables to be overridden in production.
 
 from __future__ import annotations
 
+import functools
 import os
+import re
 from pathlib import Path
 from typing import Set
 
@@ -15,18 +17,30 @@ from typing import Set
 # .env loading
 # ---------------------------------------------------------------------------
 
-# Attempt to load a .env file located two directories up from this file.  This
-# allows the app to pick up environment variables from a local .env file
-# without requiring the user to install python-dotenv.  If a variable is
-# already defined in the environment, it is not overwritten.
 _env_path = Path(__file__).resolve().parent.parent / ".env"
-if _env_path.exists():
-    for _line in _env_path.read_text().splitlines():
-        _line = _line.strip()
-        if not _line or _line.startswith("#") or "=" not in _line:
-            continue
-        _key, _val = _line.split("=", 1)
-        os.environ.setdefault(_key.strip(), _val.strip())
+
+# Matches `KEY=value` assignments, skipping blank and comment lines.
+_ENV_LINE_RE = re.compile(r"^\s*([^#=\s][^=]*)=(.*)$", re.M)
+
+
+@functools.lru_cache(maxsize=1)
+def _load_env() -> None:
+    """Load variables from a local .env file into the environment once.
+
+    This allows the app to pick up environment variables from a local .env
+    file without requiring the user to install python-dotenv.  Variables
+    already defined in the environment are not overwritten; the file always
+    supplements whatever the environment is missing.  The ``lru_cache`` guard
+    keeps Streamlit's module reloads from re-reading and re-parsing the file
+    on every rerun.
+    """
+    if not _env_path.exists():
+        return
+    for match in _ENV_LINE_RE.finditer(_env_path.read_text()):
+        os.environ.setdefault(match.group(1).strip(), match.group(2).strip())
+
+
+_load_env()
 
 # ---------------------------------------------------------------------------
 # Configuration values
@@ -2,44 +2,50 @@
 
 This package provides reusable functions for interacting with Appwrite,
 generating content with OpenAI, managing bots, and authentication helpers.
+
+The submodules are loaded lazily (PEP 562): pages that only need a light
+helper such as ``is_admin`` no longer pay the import cost of the Appwrite and
+OpenAI SDKs at first touch of ``helpers``.
 """
 
-from .appwrite_utils import q_equal, list_documents, create_document, update_document
-from .openai_utils import generate_post_using_chatgpt, generate_comment_using_chatgpt, call_openai_image
-from .bot_utils import (
-    find_important_people,
-    get_user_posts,
-    create_post,
-    create_comment,
-    add_like_to_post,
-    add_like_to_comment,
-    get_comments_for_post,
-    run_post_bot,
-    run_comment_bot,
-    run_reaction_bot,
-    run_bots_once,
-)
-from .auth_utils import require_login, is_admin
-
-__all__ = [
-    "q_equal",
-    "list_documents",
-    "create_document",
-    "update_document",
-    "generate_post_using_chatgpt",
-    "generate_comment_using_chatgpt",
-    "call_openai_image",
-    "find_important_people",
-    "get_user_posts",
-    "create_post",
-    "create_comment",
-    "add_like_to_post",
-    "add_like_to_comment",
-    "get_comments_for_post",
-    "run_post_bot",
-    "run_comment_bot",
-    "run_reaction_bot",
-    "run_bots_once",
-    "require_login",
-    "is_admin",
-]
\ No newline at end of file
+import importlib
+
+# Maps each re-exported name to the submodule that provides it.
+_LAZY = {
+    "q_equal": ".appwrite_utils",
+    "list_documents": ".appwrite_utils",
+    "create_document": ".appwrite_utils",
+    "update_document": ".appwrite_utils",
+    "generate_post_using_chatgpt": ".openai_utils",
+    "generate_comment_using_chatgpt": ".openai_utils",
+    "call_openai_image": ".openai_utils",
+    "find_important_people": ".bot_utils",
+    "get_user_posts": ".bot_utils",
+    "create_post": ".bot_utils",
+    "create_comment": ".bot_utils",
+    "add_like_to_post": ".bot_utils",
+    "add_like_to_comment": ".bot_utils",
+    "get_comments_for_post": ".bot_utils",
+    "run_post_bot": ".bot_utils",
+    "run_comment_bot": ".bot_utils",
+    "run_reaction_bot": ".bot_utils",
+    "run_bots_once": ".bot_utils",
+    "require_login": ".auth_utils",
+    "is_admin": ".auth_utils",
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        module = importlib.import_module(_LAZY[name], __name__)
+        value = getattr(module, name)
+        # Cache on the package so the import machinery only runs once per name.
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
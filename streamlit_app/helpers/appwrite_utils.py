@@ -12,7 +12,6 @@ We expose a small set of convenience functions that the rest of the app uses:
 from __future__ import annotations
 
 from typing import Any, Dict, List, Optional
-from config import IMAGE_BUCKET_ID
 
 from appwrite.client import Client
 from appwrite.id import ID
@@ -20,35 +19,77 @@ from appwrite.query import Query
 from appwrite.services.tables_db import TablesDB
 from appwrite.services.storage import Storage
 from appwrite.input_file import InputFile
-import requests
+import atexit
+import threading
+
+import httpx
 
 from config import (
     APPWRITE_ENDPOINT,
     APPWRITE_PROJECT_ID,
     APPWRITE_API_KEY,
     DATABASE_ID,
+    IMAGE_BUCKET_ID,
 )
 
 # ---------------------------------------------------------------------------
 # Singleton client + TablesDB
 # ---------------------------------------------------------------------------
 
+# One client (and service) per process, shared by every page and session —
+# the same lifetime st.cache_resource would give, without making this module
+# depend on Streamlit.  The lock keeps concurrent bot threads from racing the
+# first construction and each ending up with its own connection pool.
 _client: Optional[Client] = None
 _tables_db: Optional[TablesDB] = None
 _storage: Optional[Storage] = None
+_client_lock = threading.Lock()
+
+# Shared HTTP client for image downloads (e.g. bot-generated images from
+# OpenAI).  Connection pooling avoids a fresh TCP+TLS handshake per download.
+_HTTP = httpx.Client(timeout=30.0, limits=httpx.Limits(max_keepalive_connections=20))
+atexit.register(_HTTP.close)
+
+
+def _install_pooled_transport() -> None:
+    """Route the SDK's HTTP calls through a pooled ``requests.Session``.
+
+    ``Client.call`` invokes the module-level ``requests.request`` directly —
+    there is no session attribute to configure — so every list_rows pays a
+    fresh TCP+TLS handshake.  A ``Session`` exposes a compatible ``request``
+    method, so swapping the module reference the SDK holds for one (with a
+    sized HTTPAdapter) gives every SDK call keep-alive pooling.
+    """
+    import appwrite.client as appwrite_client
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    if isinstance(getattr(appwrite_client, "requests", None), requests.Session):
+        return
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=20, pool_maxsize=100)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    # The SDK reaches other names through the same reference (e.g.
+    # requests.exceptions in error paths); keep them resolvable.
+    session.exceptions = requests.exceptions
+    appwrite_client.requests = session
 
 
 def _get_client() -> Client:
     """Return a singleton Appwrite Client configured from config.py."""
     global _client
     if _client is None:
-        c = Client()
-        (
-            c.set_endpoint(APPWRITE_ENDPOINT)
-             .set_project(APPWRITE_PROJECT_ID)
-             .set_key(APPWRITE_API_KEY)
-        )
-        _client = c
+        with _client_lock:
+            if _client is None:
+                c = Client()
+                (
+                    c.set_endpoint(APPWRITE_ENDPOINT)
+                     .set_project(APPWRITE_PROJECT_ID)
+                     .set_key(APPWRITE_API_KEY)
+                )
+                _install_pooled_transport()
+                _client = c
     return _client
 
 
@@ -56,14 +97,20 @@ def _get_tables_db() -> TablesDB:
     """Return a singleton TablesDB service."""
     global _tables_db
     if _tables_db is None:
-        _tables_db = TablesDB(_get_client())
+        client = _get_client()
+        with _client_lock:
+            if _tables_db is None:
+                _tables_db = TablesDB(client)
     return _tables_db
 
 def _get_storage() -> Storage:
     """Return a singleton Storage service."""
     global _storage
     if _storage is None:
-        _storage = Storage(_get_client())
+        client = _get_client()
+        with _client_lock:
+            if _storage is None:
+                _storage = Storage(client)
     return _storage
 
 # ---------------------------------------------------------------------------
@@ -88,6 +135,44 @@ def q_equal(field: str, value: Any) -> str:
     return Query.equal(field, value)
 
 
+def q_select(fields: List[str]) -> str:
+    """
+    Thin wrapper around Query.select.
+
+    Asks Appwrite to return only the given fields, so callers that need just a
+    couple of attributes don't ship (and JSON-parse) whole documents.
+    """
+    return Query.select(fields)
+
+
+def q_limit(count: int) -> str:
+    """
+    Thin wrapper around Query.limit, capping how many rows the server returns.
+    """
+    return Query.limit(count)
+
+
+def q_offset(count: int) -> str:
+    """
+    Thin wrapper around Query.offset, skipping the first ``count`` rows.
+    """
+    return Query.offset(count)
+
+
+def q_order_desc(field: str) -> str:
+    """
+    Thin wrapper around Query.order_desc, sorting results by ``field`` descending.
+    """
+    return Query.order_desc(field)
+
+
+def q_cursor_after(document_id: str) -> str:
+    """
+    Thin wrapper around Query.cursor_after, for cursor-based pagination.
+    """
+    return Query.cursor_after(document_id)
+
+
 # ---------------------------------------------------------------------------
 # “Document” helpers (actually rows in TablesDB)
 # ---------------------------------------------------------------------------
@@ -114,6 +199,52 @@ def list_documents(
     return result.get("rows", [])
 
 
+def list_all_documents(
+    table_id: str,
+    queries: Optional[List[str]] = None,
+    page_size: int = 100,
+) -> List[Dict[str, Any]]:
+    """
+    List every row matching ``queries``, paging with cursors.
+
+    Appwrite caps unpaginated listings, so callers that really need the whole
+    table should walk it in ``page_size`` chunks.  Any ``q_select`` in
+    ``queries`` must include ``$id`` — the cursor is taken from the last row
+    of each page.
+    """
+    base = list(queries or [])
+    rows: List[Dict[str, Any]] = []
+    cursor: Optional[str] = None
+    while True:
+        page_queries = base + [q_limit(page_size)]
+        if cursor is not None:
+            page_queries.append(q_cursor_after(cursor))
+        page = list_documents(table_id, page_queries)
+        rows.extend(page)
+        if len(page) < page_size:
+            return rows
+        cursor = page[-1].get("$id")
+
+
+def count_documents(
+    table_id: str,
+    queries: Optional[List[str]] = None,
+) -> int:
+    """
+    Return how many rows match ``queries`` without shipping the rows.
+
+    Appwrite reports the total match count alongside every page, so asking
+    for a single projected row is enough to read it.
+    """
+    tables = _get_tables_db()
+    result = tables.list_rows(
+        database_id=DATABASE_ID,
+        table_id=table_id,
+        queries=(queries or []) + [q_select(["$id"]), q_limit(1)],
+    )
+    return result.get("total", 0)
+
+
 def create_document(
     table_id: str,
     document_id: str,
@@ -149,6 +280,30 @@ def update_document(
         data=data,
     )
 
+
+def bulk_update_documents(
+    table_id: str,
+    updates: List[Dict[str, Any]],
+) -> List[Dict[str, Any]]:
+    """
+    Update many rows in a single request via the TablesDB bulk endpoint.
+
+    Each entry in ``updates`` must carry its row ID under ``"$id"`` alongside
+    the fields to change.  One request replaces N sequential update_document
+    round trips (the endpoint accepts up to 1000 rows per call).  The SDK's
+    per-row bulk method is ``upsert_rows``; ``update_rows`` applies one data
+    payload to a query match instead.
+    """
+    if not updates:
+        return []
+    tables = _get_tables_db()
+    result = tables.upsert_rows(
+        database_id=DATABASE_ID,
+        table_id=table_id,
+        rows=updates,
+    )
+    return result.get("rows", [])
+
 # ---------------------------------------------------------------------------
 # “Bucket” helpers for uploading images
 # ---------------------------------------------------------------------------
@@ -181,10 +336,20 @@ def upload_image_from_url(url: str, file_name: str = "image.png") -> str:
     Download an image from a URL and upload it to Appwrite.
     Returns the new file ID.
     Useful for bot-generated images (e.g. from OpenAI).
+
+    The download is streamed straight into the upload buffer, so the image
+    (a 1024x1024 PNG can run to a few MB) crosses the Python heap once
+    instead of being materialised as response.content and copied again.
     """
-    resp = requests.get(url)
-    resp.raise_for_status()
-    return upload_image_file(file_name, resp.content)
+    with _HTTP.stream("GET", url) as resp:
+        resp.raise_for_status()
+        storage = _get_storage()
+        result = storage.create_file(
+            bucket_id=IMAGE_BUCKET_ID,
+            file_id=ID.unique(),
+            file=InputFile.from_bytes(resp.read(), file_name),
+        )
+    return result["$id"]
 
 
 def generate_id() -> str:
@@ -13,21 +13,28 @@ import streamlit as st
 
 from config import ADMIN_EMAILS
 
+# Frozen, lower-cased copy of the admin list built once at import.  is_admin
+# runs on every Streamlit rerun, so membership should be an O(1) hash probe —
+# and comparing case-insensitively avoids locking out admins whose mail
+# client capitalises their address.
+_ADMIN_EMAILS = frozenset(e.lower() for e in ADMIN_EMAILS)
 
-def require_login() -> bool:
-    """Return True if a user is logged in, otherwise show an error and stop.
+
+def require_login() -> dict:
+    """Return the logged-in user, otherwise show an error and stop.
 
     If ``st.session_state`` does not contain a ``'user'`` key, this function
     displays an error message prompting the user to log in on the Login page
     and calls ``st.stop()`` to prevent the rest of the page from rendering.
+    Returning the user document saves callers repeated session-state lookups.
 
     Returns:
-        True if a user is logged in, otherwise does not return.
+        The user document if a user is logged in, otherwise does not return.
     """
     if 'user' not in st.session_state:
         st.error("You must log in via the Login page before accessing this page.")
         st.stop()
-    return True
+    return st.session_state['user']
 
 
 def is_admin() -> bool:
@@ -36,4 +43,4 @@ def is_admin() -> bool:
     if not user:
         return False
     email = user.get('email')
-    return email in ADMIN_EMAILS
+    return (email or "").lower() in _ADMIN_EMAILS
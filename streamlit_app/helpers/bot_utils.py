@@ -9,13 +9,22 @@ databases and for running bots.  It depends on the low‑level functions in
 from __future__ import annotations
 
 import random
-from typing import Any, Dict, List, Optional, Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, FrozenSet, List, Optional
+
+import streamlit as st
 
 from helpers.appwrite_utils import (
     q_equal,
+    q_limit,
+    q_offset,
+    q_order_desc,
+    q_select,
+    count_documents,
     list_documents,
     create_document,
     update_document,
+    bulk_update_documents,
     generate_id,
     upload_image_from_url,
 )
@@ -32,25 +41,77 @@ from config import (
 )
 
 
+@st.cache_data(ttl=60, show_spinner=False)
 def find_important_people() -> List[str]:
-    """Return a list of user IDs with a popularity score of 1."""
-    docs = list_documents(USERS_COLLECTION_ID, [q_equal("popularityscore", 1)])
+    """Return a list of user IDs with a popularity score of 1.
+
+    Only the IDs are needed, so the query projects down to ``$id`` instead of
+    shipping whole user records.  The result changes rarely (users pick their
+    popularity at registration), so it is cached for a minute.
+    """
+    docs = list_documents(
+        USERS_COLLECTION_ID,
+        [q_equal("popularityscore", 1), q_select(["$id"])],
+    )
     return [doc.get("$id") for doc in docs]
 
 
+@st.cache_data(ttl=30, show_spinner=False)
+def _list_bots() -> List[Dict[str, Any]]:
+    """Return all bot documents, cached briefly across runs and reruns."""
+    return list_documents(BOTS_COLLECTION_ID)
+
+
 def get_user_posts(user_id: str) -> List[Dict[str, Any]]:
-    """Return all posts created by a specific user."""
-    return list_documents(POSTS_COLLECTION_ID, [q_equal("userid", user_id)])
+    """Return all posts created by a specific user.
+
+    The bots only look at a post's ID, title, content and like count, so the
+    query selects just those fields to keep payloads small.
+    """
+    return list_documents(
+        POSTS_COLLECTION_ID,
+        [q_equal("userid", user_id), q_select(["$id", "title", "content", "likes"])],
+    )
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _count_user_posts(user_id: str) -> int:
+    """Return how many posts a user has, cached briefly across iterations."""
+    return count_documents(POSTS_COLLECTION_ID, [q_equal("userid", user_id)])
+
+
+def get_random_user_post(user_id: str) -> Optional[Dict[str, Any]]:
+    """Return one random post by a user without fetching their whole feed.
+
+    Instead of listing every post just to hand the result to
+    ``random.choice``, this asks Appwrite for a single row at a random offset
+    among the user's most recent posts.
+    """
+    count = _count_user_posts(user_id)
+    if not count:
+        return None
+    offset = random.randint(0, min(count - 1, 50))
+    docs = list_documents(
+        POSTS_COLLECTION_ID,
+        [
+            q_equal("userid", user_id),
+            q_order_desc("$createdAt"),
+            q_offset(offset),
+            q_limit(1),
+            q_select(["$id", "title", "content", "likes"]),
+        ],
+    )
+    return docs[0] if docs else None
 
 
 def create_post(title: str, content: str, imageurl: Optional[str], user_id: str) -> None:
     """Create a post in the posts collection.
 
     The content length is truncated to 500 characters as in the JavaScript
-    implementation.  Likes are initialised to 0.
+    implementation; with the generators capped at 250 completion tokens this
+    is now a rarely taken safety net.  Likes are initialised to 0.
     """
-    if len(content) > 500:
-        content = content[:500]
+    content = content if len(content) <= 500 else content[:500]
     data = {
         "title": title,
         "content": content,
@@ -86,28 +147,66 @@ def add_like_to_comment(comment_id: str, current_likes: int) -> None:
     update_document(COMMENTS_COLLECTION_ID, comment_id, {"likes": current_likes + 1})
 
 
-def get_comments_for_post(post_id: str) -> List[Dict[str, Any]]:
-    """Return all comments belonging to a particular post."""
-    return list_documents(COMMENTS_COLLECTION_ID, [q_equal("postid", post_id)])
-
+def get_comments_for_post(
+    post_id: str,
+    fields: Optional[List[str]] = None,
+) -> List[Dict[str, Any]]:
+    """Return all comments belonging to a particular post.
 
-def run_post_bot(bot: Dict[str, Any], important_people: List[str], logs: List[str]) -> None:
+    ``fields`` optionally restricts which attributes the server returns; the
+    Feed page needs full comments, while the reaction bots only need IDs,
+    authors and like counts.
+    """
+    queries = [q_equal("postid", post_id)]
+    if fields:
+        queries.append(q_select(fields))
+    return list_documents(COMMENTS_COLLECTION_ID, queries)
+
+
+def _pick_post(
+    target_user: str,
+    posts_by_user: Optional[Dict[str, List[Dict[str, Any]]]],
+) -> Optional[Dict[str, Any]]:
+    """Pick one random post by ``target_user``.
+
+    ``run_bots_once`` fetches each important user's posts once up front, so
+    the pick is a local ``random.choice`` on the prefetched map.  Without a
+    map only a single post is needed, so Appwrite is asked for exactly one at
+    a random offset rather than the user's whole feed.
+    """
+    if posts_by_user is not None:
+        posts = posts_by_user.get(target_user, [])
+        return random.choice(posts) if posts else None
+    return get_random_user_post(target_user)
+
+
+def run_post_bot(
+    bot: Dict[str, Any],
+    important_people: List[str],
+    logs: List[str],
+    posts_by_user: Optional[Dict[str, List[Dict[str, Any]]]] = None,
+    target_user: Optional[str] = None,
+    post: Optional[Dict[str, Any]] = None,
+) -> None:
     """Execute a single iteration of a post bot.
 
     Chooses a random important user, selects one of their posts, and posts a new
     generated message (with optional image) to the feed.  All noteworthy
-    actions are appended to ``logs``.
+    actions are appended to ``logs``.  ``run_bots_once`` pre-samples the
+    ``target_user``/``post`` pair for every iteration up front; when they are
+    not supplied this function samples them itself.
     """
     tone = bot.get("tone")
     if not important_people:
         logs.append(f"Bot {bot.get('$id')} could not find any important people to post about.")
         return
-    target_user = random.choice(important_people)
-    posts = get_user_posts(target_user)
-    if not posts:
+    if target_user is None:
+        target_user = random.choice(important_people)
+    if post is None:
+        post = _pick_post(target_user, posts_by_user)
+    if post is None:
         logs.append(f"Bot {bot.get('$id')} found no posts by important user {target_user}.")
         return
-    post = random.choice(posts)
     original_text = f"title: {post.get('title', '')}, content: {post.get('content', '')}"
     generated = generate_post_using_chatgpt(original_text, tone)
     if not generated:
@@ -130,18 +229,26 @@ def run_post_bot(bot: Dict[str, Any], important_people: List[str], logs: List[st
     logs.append(f"Bot {bot.get('$id')} posted a new message titled '{title}'.")
 
 
-def run_comment_bot(bot: Dict[str, Any], important_people: List[str], logs: List[str]) -> None:
+def run_comment_bot(
+    bot: Dict[str, Any],
+    important_people: List[str],
+    logs: List[str],
+    posts_by_user: Optional[Dict[str, List[Dict[str, Any]]]] = None,
+    target_user: Optional[str] = None,
+    post: Optional[Dict[str, Any]] = None,
+) -> None:
     """Execute a single iteration of a comment bot."""
     tone = bot.get("tone")
     if not important_people:
         logs.append(f"Bot {bot.get('$id')} could not find any important people to comment on.")
         return
-    target_user = random.choice(important_people)
-    posts = get_user_posts(target_user)
-    if not posts:
+    if target_user is None:
+        target_user = random.choice(important_people)
+    if post is None:
+        post = _pick_post(target_user, posts_by_user)
+    if post is None:
         logs.append(f"Bot {bot.get('$id')} found no posts by important user {target_user} to comment on.")
         return
-    post = random.choice(posts)
     content_dict = generate_comment_using_chatgpt(f"content: {post.get('content', '')}", tone)
     if not content_dict or not content_dict.get("comment"):
         logs.append(f"Bot {bot.get('$id')} could not generate a comment via ChatGPT.")
@@ -150,51 +257,123 @@ def run_comment_bot(bot: Dict[str, Any], important_people: List[str], logs: List
     logs.append(f"Bot {bot.get('$id')} commented on post {post.get('$id')}.")
 
 
-def run_reaction_bot(bot: Dict[str, Any], important_people: List[str], bot_ids: List[str], logs: List[str]) -> None:
+def run_reaction_bot(
+    bot: Dict[str, Any],
+    important_people: List[str],
+    bot_ids: FrozenSet[str],
+    logs: List[str],
+    posts_by_user: Optional[Dict[str, List[Dict[str, Any]]]] = None,
+    target_user: Optional[str] = None,
+    post: Optional[Dict[str, Any]] = None,
+) -> None:
     """Execute a single iteration of a reaction bot.
 
     Likes a random important user’s post and then likes any comments on that post
-    made by bots or important users.
+    made by bots or important users.  ``bot_ids`` should be a set so the
+    per-comment membership checks are O(1) hash probes rather than list scans.
     """
     if not important_people:
         logs.append(f"Bot {bot.get('$id')} could not find any important people to react to.")
         return
-    target_user = random.choice(important_people)
-    posts = get_user_posts(target_user)
-    if not posts:
+    if target_user is None:
+        target_user = random.choice(important_people)
+    if post is None:
+        post = _pick_post(target_user, posts_by_user)
+    if post is None:
         logs.append(f"Bot {bot.get('$id')} found no posts by important user {target_user} to react to.")
         return
-    post = random.choice(posts)
     post_id = post.get("$id")
     current_likes = post.get("likes", 0)
     add_like_to_post(post_id, current_likes)
     logs.append(f"Bot {bot.get('$id')} liked post {post_id}.")
-    # Like comments by bots or important people
-    comments = get_comments_for_post(post_id)
+    # Like comments by bots or important people.  The likes are collected and
+    # written in one bulk request instead of one round trip per comment.
+    comments = get_comments_for_post(post_id, fields=["$id", "userid", "likes"])
+    important_people_set = frozenset(important_people)
+    pending_likes: List[Dict[str, Any]] = []
+    pending_logs: List[str] = []
     for comment in comments:
         comment_user_id = comment.get("userid")
-        if comment_user_id in bot_ids or comment_user_id in important_people:
-            add_like_to_comment(comment.get("$id"), comment.get("likes", 0))
-            logs.append(
+        if comment_user_id in bot_ids or comment_user_id in important_people_set:
+            pending_likes.append(
+                {"$id": comment.get("$id"), "likes": comment.get("likes", 0) + 1}
+            )
+            pending_logs.append(
                 f"Bot {bot.get('$id')} liked comment {comment.get('$id')} by user {comment_user_id}."
             )
+    if pending_likes:
+        # Log only once the bulk write has succeeded, so the log never claims
+        # likes that were not persisted.
+        bulk_update_documents(COMMENTS_COLLECTION_ID, pending_likes)
+        logs.extend(pending_logs)
+
+
+# Upper bound on concurrent bot iterations.  Every iteration is dominated by
+# OpenAI/Appwrite network round trips, so threads spend nearly all their time
+# waiting and a fairly wide pool is safe.
+_MAX_BOT_WORKERS = 16
+
+
+def _dispatch_bot(
+    bot: Dict[str, Any],
+    bottype: str,
+    important_people: List[str],
+    bot_ids: FrozenSet[str],
+    logs: List[str],
+    posts_by_user: Optional[Dict[str, List[Dict[str, Any]]]] = None,
+    target_user: Optional[str] = None,
+    post: Optional[Dict[str, Any]] = None,
+) -> None:
+    """Run a single bot iteration of the given type, logging into ``logs``."""
+    if bottype == "post":
+        run_post_bot(bot, important_people, logs, posts_by_user, target_user, post)
+    elif bottype == "comment":
+        run_comment_bot(bot, important_people, logs, posts_by_user, target_user, post)
+    elif bottype == "reaction":
+        run_reaction_bot(bot, important_people, bot_ids, logs, posts_by_user, target_user, post)
+    else:
+        logs.append(f"Bot {bot.get('$id')} has unknown type '{bottype}'.")
 
 
 def run_bots_once(logs: List[str]) -> None:
     """Run one iteration for every bot based on its type and activity level.
 
     This function fetches fresh bot and important people lists on each call to
-    reflect the current database state.
+    reflect the current database state.  Each bot iteration blocks on several
+    OpenAI and Appwrite round trips, so the iterations are executed on a
+    thread pool rather than serially; every task appends to its own log list
+    and the lists are merged in submission order afterwards.
     """
     # Fetch all bots
-    bot_docs = list_documents(BOTS_COLLECTION_ID)
+    bot_docs = _list_bots()
     if not bot_docs:
         logs.append("No bots found in the database.")
         return
     # Determine the list of important people
     important_people = find_important_people()
-    # Precompute a list of bot IDs for reaction bots to identify comments by bots
-    bot_ids = [b.get("$id") for b in bot_docs]
+    # Precompute the set of bot IDs for reaction bots to identify comments by
+    # bots with O(1) membership checks
+    bot_ids = frozenset(b.get("$id") for b in bot_docs)
+    # Fetch every important user's posts once for the whole run; iterations
+    # would otherwise refetch the same posts from Appwrite over and over.
+    posts_by_user = {uid: get_user_posts(uid) for uid in important_people}
+
+    def _pre_pick(count: int) -> List[tuple]:
+        """Pre-sample ``count`` (target_user, post) pairs in one pass.
+
+        ``random.choices`` draws all targets at once, so the worker threads
+        never touch the shared random state and skip resampling entirely.
+        """
+        if not important_people:
+            return [(None, None)] * count
+        picks = []
+        for target in random.choices(important_people, k=count):
+            posts = posts_by_user.get(target) or []
+            picks.append((target, random.choice(posts) if posts else None))
+        return picks
+
+    # Expand every bot into one task per activity step
+    tasks: List[tuple] = []
     for bot in bot_docs:
         bottype = bot.get("bottype")
         activity = bot.get("activitylevel", 0)
@@ -203,15 +382,34 @@ def run_bots_once(logs: List[str]) -> None:
             activity_count = int(activity)
         except (TypeError, ValueError):
             activity_count = 0
-        for _ in range(activity_count):
-            if bottype == "post":
-                run_post_bot(bot, important_people, logs)
-            elif bottype == "comment":
-                run_comment_bot(bot, important_people, logs)
-            elif bottype == "reaction":
-                run_reaction_bot(bot, important_people, bot_ids, logs)
-            else:
-                logs.append(f"Bot {bot.get('$id')} has unknown type '{bottype}'.")
+        tasks.extend(
+            (bot, bottype, target, post) for target, post in _pre_pick(activity_count)
+        )
+    if not tasks:
+        return
+
+    with ThreadPoolExecutor(max_workers=min(_MAX_BOT_WORKERS, len(tasks))) as executor:
+        futures = []
+        for bot, bottype, target, post in tasks:
+            task_logs: List[str] = []
+            future = executor.submit(
+                _dispatch_bot,
+                bot,
+                bottype,
+                important_people,
+                bot_ids,
+                task_logs,
+                posts_by_user,
+                target,
+                post,
+            )
+            futures.append((future, bot, task_logs))
+        for future, bot, task_logs in futures:
+            try:
+                future.result()
+            except Exception as exc:
+                logs.append(f"Bot {bot.get('$id')} failed with an error: {exc}")
+            logs.extend(task_logs)
 
 
 def run_bots_once_callback(
@@ -230,14 +428,16 @@ def run_bots_once_callback(
             be invoked for each log entry generated during the run.
     """
     # Fetch all bots
-    bot_docs = list_documents(BOTS_COLLECTION_ID)
+    bot_docs = _list_bots()
     if not bot_docs:
         callback("No bots found in the database.")
         return
     # Determine the list of important people
     important_people = find_important_people()
-    # Precompute bot ids
-    bot_ids = [b.get("$id") for b in bot_docs]
+    # Precompute bot ids as a set for O(1) membership checks
+    bot_ids = frozenset(b.get("$id") for b in bot_docs)
+    # Fetch every important user's posts once for the whole run
+    posts_by_user = {uid: get_user_posts(uid) for uid in important_people}
 
     # Log buffer for one timestep
     logs: List[str] = []
@@ -253,17 +453,7 @@ def run_bots_once_callback(
 
         for _ in range(activity_count):
 
-            if bottype == "post":
-                run_post_bot(bot, important_people, logs)
-
-            elif bottype == "comment":
-                run_comment_bot(bot, important_people, logs)
-
-            elif bottype == "reaction":
-                run_reaction_bot(bot, important_people, bot_ids, logs)
-
-            else:
-                logs.append(f"Bot {bot.get('$id')} has unknown type '{bottype}'.")
+            _dispatch_bot(bot, bottype, important_people, bot_ids, logs, posts_by_user)
 
             # 🔥 Flush logs immediately through the callback
             while logs:
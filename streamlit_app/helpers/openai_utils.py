@@ -8,18 +8,35 @@ should occur.
 
 from __future__ import annotations
 
+import atexit
+import hashlib
 import json
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 
-import requests
+import httpx
 
 from config import OPENAI_API_KEY
 
+# Shared HTTP client with keep-alive connection pooling.  Opening a fresh
+# TCP+TLS connection to api.openai.com per call costs ~150-300 ms; a pooled
+# client pays the handshake once and reuses the connection across bot
+# iterations.
+_HTTP = httpx.Client(
+    timeout=30.0,
+    limits=httpx.Limits(
+        max_keepalive_connections=20,
+        max_connections=100,
+        keepalive_expiry=30.0,
+    ),
+)
+atexit.register(_HTTP.close)
+
 
 def call_openai_chat(
     messages: List[Dict[str, str]],
     functions: Optional[List[Dict[str, Any]]] = None,
     function_call: Optional[Dict[str, str]] = None,
+    max_tokens: int = 400,
 ) -> Optional[Dict[str, Any]]:
     """Call the OpenAI chat completions API and return function call arguments.
 
@@ -28,6 +45,8 @@ def call_openai_chat(
         functions: Optional list of function specifications as accepted by
             OpenAI.  See the original JavaScript for examples.
         function_call: Optional directive specifying which function to call.
+        max_tokens: Completion-length cap passed to the API; callers with a
+            known output budget should lower it to cut billed tokens.
 
     Returns:
         Parsed JSON arguments from the function call if present, else ``None``.
@@ -43,17 +62,17 @@ def call_openai_chat(
     payload: Dict[str, Any] = {
         "model": "gpt-4o",
         "messages": messages,
-        "max_tokens": 400,
+        "max_tokens": max_tokens,
     }
     if functions:
         payload["functions"] = functions
     if function_call:
         payload["function_call"] = function_call
     try:
-        response = requests.post(url, headers=headers, json=payload)
-    except requests.exceptions.RequestException:
+        response = _HTTP.post(url, headers=headers, json=payload)
+    except httpx.HTTPError:
         return None
-    if not response.ok:
+    if not response.is_success:
         return None
     result = response.json()
     try:
@@ -84,10 +103,10 @@ def call_openai_image(prompt: str) -> Optional[str]:
         "size": "1024x1024",
     }
     try:
-        response = requests.post(url, headers=headers, json=payload)
-    except requests.exceptions.RequestException:
+        response = _HTTP.post(url, headers=headers, json=payload)
+    except httpx.HTTPError:
         return None
-    if not response.ok:
+    if not response.is_success:
         return None
     data = response.json().get("data", [])
     if not data:
@@ -95,45 +114,116 @@ def call_openai_image(prompt: str) -> Optional[str]:
     return data[0].get("url")
 
 
+# ---------------------------------------------------------------------------
+# Generation cache
+# ---------------------------------------------------------------------------
+
+# Bots repeatedly pick from the same handful of important users' posts, so
+# identical (post, tone) prompts would otherwise re-hit OpenAI — ~500 ms and
+# real money per duplicate.  Successful generations are memoized by content
+# hash and tone; failures are not cached so transient errors can retry.
+_generation_cache: Dict[tuple, Dict[str, str]] = {}
+_GENERATION_CACHE_MAX = 1024
+
+
+def _cached_generation(
+    kind: str,
+    original_post: str,
+    bot_tone: str,
+    generate: Callable[[], Optional[Dict[str, str]]],
+) -> Optional[Dict[str, str]]:
+    """Return a cached generation for (kind, post, tone), or run ``generate``."""
+    digest = hashlib.blake2b(original_post.encode("utf-8"), digest_size=16).hexdigest()
+    key = (kind, digest, bot_tone)
+    if key in _generation_cache:
+        return _generation_cache[key]
+    result = generate()
+    if result is not None:
+        if len(_generation_cache) >= _GENERATION_CACHE_MAX:
+            # Drop the oldest entry; insertion order doubles as age order.
+            _generation_cache.pop(next(iter(_generation_cache)))
+        _generation_cache[key] = result
+    return result
+
+
+# Function specifications and system messages are identical for every call, so
+# they are built once at import instead of being re-allocated (and, previously,
+# re-interpolated with the whole original post — dead weight, since the same
+# text already travels in the user message) on each bot iteration.
+_POST_SYSTEM_MSG = {
+    "role": "system",
+    "content": "You are a helpful assistant. Use the supplied tools to assist the user in a human way.",
+}
+_COMMENT_SYSTEM_MSG = {
+    "role": "system",
+    "content": "You are a helpful assistant. Use the supplied tools to assist the user.",
+}
+_POST_FUNCTIONS = [
+    {
+        "name": "generate_post",
+        "description": (
+            "Generate a new post based on the original post in the user message. "
+            "Write the post like someone would on social media. Make it seem it's written by a human and not AI."
+            "The new post should have the specific tone given by the user. Also make sure that this tone is reflected in both the title and content of the post in a human on social media way."
+            "The new post should be generated using the ChatGPT model."
+        ),
+        "parameters": {
+            "type": "object",
+            "required": ["title", "content"],
+            "properties": {
+                "title": {
+                    "type": "string",
+                    "description": (
+                        "The title of the new post, related to the original post, "
+                        "but with a specific tone"
+                    ),
+                },
+                "content": {
+                    "type": "string",
+                    "description": (
+                        "The content of the post, related to the original post, "
+                        "but with a specific tone"
+                    ),
+                },
+            },
+            "additionalProperties": False,
+        },
+    }
+]
+_COMMENT_FUNCTIONS = [
+    {
+        "name": "generate_comment",
+        "description": (
+            "Generate a new comment based on the original post in the user message. "
+            "Write the comment like someone would on social media. Make it seem it's written by a human and not AI."
+            "The new comment should have the specific tone given by the user. Also make sure that this tone is reflected in the comment in a human on social media way."
+            "The new comment should be generated using the ChatGPT model."
+        ),
+        "parameters": {
+            "type": "object",
+            "required": ["comment"],
+            "properties": {
+                "comment": {
+                    "type": "string",
+                    "description": (
+                        "The content of the comment, related to the original post, but with a specific tone"
+                    ),
+                },
+            },
+            "additionalProperties": False,
+        },
+    }
+]
+
+
 def generate_post_using_chatgpt(original_post: str, bot_tone: str) -> Optional[Dict[str, str]]:
     """Generate a new post title and content using ChatGPT.
 
     Returns a dictionary with ``title`` and ``content`` keys, or ``None`` if
     generation is disabled or fails.
     """
-    functions = [
-        {
-            "name": "generate_post",
-            "description": (
-                f"Generate a new post based on the original post: {original_post}. Write the post like someone would on social media. Make it seem it's written by a human and not AI."
-                f"The new post should have a specific tone: {bot_tone}. Also make sure that this tone is reflected in both the title and content of the post in a human on social media way."
-                "The new post should be generated using the ChatGPT model."
-            ),
-            "parameters": {
-                "type": "object",
-                "required": ["title", "content"],
-                "properties": {
-                    "title": {
-                        "type": "string",
-                        "description": (
-                            "The title of the new post, related to the original post, "
-                            "but with a specific tone"
-                        ),
-                    },
-                    "content": {
-                        "type": "string",
-                        "description": (
-                            "The content of the post, related to the original post, "
-                            "but with a specific tone"
-                        ),
-                    },
-                },
-                "additionalProperties": False,
-            },
-        }
-    ]
     messages = [
-        {"role": "system", "content": "You are a helpful assistant. Use the supplied tools to assist the user in a human way."},
+        _POST_SYSTEM_MSG,
         {
             "role": "user",
             "content": (
@@ -143,7 +233,14 @@ def generate_post_using_chatgpt(original_post: str, bot_tone: str) -> Optional[D
             ),
         },
     ]
-    return call_openai_chat(messages, functions, {"name": "generate_post"})
+    return _cached_generation(
+        "post",
+        original_post,
+        bot_tone,
+        lambda: call_openai_chat(
+            messages, _POST_FUNCTIONS, {"name": "generate_post"}, max_tokens=250
+        ),
+    )
 
 
 def generate_comment_using_chatgpt(original_post: str, bot_tone: str) -> Optional[Dict[str, str]]:
@@ -151,31 +248,8 @@ def generate_comment_using_chatgpt(original_post: str, bot_tone: str) -> Optiona
 
     Returns a dictionary with a single key ``comment`` or ``None``.
     """
-    functions = [
-        {
-            "name": "generate_comment",
-            "description": (
-                f"Generate a new comment based on the original post: {original_post}. Write the comment like someone would on social media. Make it seem it's written by a human and not AI."
-                f"The new comment should have a specific tone: {bot_tone}. Also make sure that this tone is reflected in the comment in a human on social media way."
-                "The new comment should be generated using the ChatGPT model."
-            ),
-            "parameters": {
-                "type": "object",
-                "required": ["comment"],
-                "properties": {
-                    "comment": {
-                        "type": "string",
-                        "description": (
-                            "The content of the comment, related to the original post, but with a specific tone"
-                        ),
-                    },
-                },
-                "additionalProperties": False,
-            },
-        }
-    ]
     messages = [
-        {"role": "system", "content": "You are a helpful assistant. Use the supplied tools to assist the user."},
+        _COMMENT_SYSTEM_MSG,
         {
             "role": "user",
             "content": (
@@ -184,4 +258,11 @@ def generate_comment_using_chatgpt(original_post: str, bot_tone: str) -> Optiona
             ),
         },
     ]
-    return call_openai_chat(messages, functions, {"name": "generate_comment"})
+    return _cached_generation(
+        "comment",
+        original_post,
+        bot_tone,
+        lambda: call_openai_chat(
+            messages, _COMMENT_FUNCTIONS, {"name": "generate_comment"}, max_tokens=250
+        ),
+    )
